@@ -6,13 +6,49 @@ Handles file operations, thumbnails, and transfer history.
 
 import os
 import json
+import hashlib
+import functools
 import shutil
+import threading
 import zipfile
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from PIL import Image
 import io
+from collections import OrderedDict
+
+
+# Thumbnails kept on disk after prune_thumbnails(), and source image sizes
+# remembered in memory
+THUMBNAIL_CACHE_LIMIT = 1000
+IMAGE_DIMENSIONS_LIMIT = 1000
+
+# Extension -> emoji for non-image files (images are matched against
+# FileManager.image_formats first)
+_EXT_TO_EMOJI = {
+    ext: emoji
+    for emoji, exts in (
+        ("🎥", ('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm')),
+        ("🎵", ('.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a')),
+        ("📄", ('.pdf', '.doc', '.docx', '.txt', '.rtf')),
+        ("📦", ('.zip', '.rar', '.7z', '.tar', '.gz')),
+        ("💻", ('.py', '.js', '.html', '.css', '.java', '.cpp', '.c', '.h')),
+    )
+    for ext in exts
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _check_jpeg_acceleration() -> bool:
+    """Report once whether Pillow's JPEG decoder is the SIMD libjpeg-turbo build"""
+    try:
+        from PIL import features
+        available = bool(features.check('libjpeg_turbo'))
+    except Exception:
+        available = False
+    if not available:
+        print("💡 Pillow is not using libjpeg-turbo; installing pillow-simd speeds up thumbnails")
+    return available
 
 
 class FileManager:
@@ -45,6 +81,15 @@ class FileManager:
         self.history: Dict[str, Dict] = {}
         self._load_history()
 
+        # Upright pixel size of source images, keyed by the path string passed
+        # to generate_thumbnail(); oldest entries are dropped past
+        # IMAGE_DIMENSIONS_LIMIT. Thumbnail workers write it concurrently
+        self.image_dimensions: Dict[str, tuple] = OrderedDict()
+        self._dimensions_lock = threading.Lock()
+
+        # get_file_info results: {file_path: (st_mtime_ns, st_size, info)}
+        self._file_info_cache: Dict[str, tuple] = {}
+
         # Supported image formats for thumbnails
         self.image_formats = {'.png', '.jpg',
                               '.jpeg', '.gif', '.bmp', '.ico', '.webp'}
@@ -96,14 +141,19 @@ class FileManager:
         Returns:
             Dictionary with file info or None
         """
-        path = Path(file_path)
-
-        if not path.exists():
+        # One stat both checks the file exists and validates the cache
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            self._file_info_cache.pop(file_path, None)
             return None
 
-        stat = path.stat()
+        cached = self._file_info_cache.get(file_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return dict(cached[2])
 
-        return {
+        path = Path(file_path)
+        info = {
             'name': path.name,
             'path': str(path.absolute()),
             'size': stat.st_size,
@@ -112,6 +162,17 @@ class FileManager:
             'is_image': path.suffix.lower() in self.image_formats,
             'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
         }
+        self._file_info_cache[file_path] = (stat.st_mtime_ns, stat.st_size, info)
+        return dict(info)
+
+    def forget_file_info(self, file_path: str) -> None:
+        """
+        Drop a file's cached info (e.g. when it stops being shared)
+
+        Args:
+            file_path: Path previously passed to get_file_info()
+        """
+        self._file_info_cache.pop(file_path, None)
 
     def generate_thumbnail(self, file_path: str, size: tuple = (128, 128)) -> Optional[Path]:
         """
@@ -126,20 +187,52 @@ class FileManager:
         """
         path = Path(file_path)
 
-        if not path.exists() or path.suffix.lower() not in self.image_formats:
+        if path.suffix.lower() not in self.image_formats:
             return None
 
         try:
-            # Create thumbnail filename
-            thumb_name = f"{path.stem}_thumb{path.suffix}"
+            stat = path.stat()
+        except OSError:
+            return None
+
+        try:
+            # Key the thumbnail on the source's identity and requested size so
+            # an edited file or a different size never reuses a stale image
+            key = f"{path.absolute()}|{stat.st_mtime_ns}|{stat.st_size}|{size[0]}x{size[1]}"
+            digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+            thumb_name = f"{path.stem}_{digest[:16]}_thumb{path.suffix}"
             thumb_path = self.thumbnails_dir / thumb_name
 
             # Check if thumbnail already exists
             if thumb_path.exists():
+                # Mark it as recently used so prune_thumbnails() keeps it
+                try:
+                    os.utime(thumb_path)
+                except OSError:
+                    pass
                 return thumb_path
 
+            # Pillow is only needed once an image thumbnail is actually requested
+            from PIL import Image, ImageOps
+            _check_jpeg_acceleration()
+
             # Generate thumbnail
             with Image.open(path) as img:
+                # Record the upright source size before draft() shrinks it
+                width, height = img.size
+                if img.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+                    width, height = height, width
+                # Keyed by the caller's string, which Path() would rewrite
+                # (forward slashes become backslashes on Windows)
+                with self._dimensions_lock:
+                    self.image_dimensions[file_path] = (width, height)
+                    while len(self.image_dimensions) > IMAGE_DIMENSIONS_LIMIT:
+                        self.image_dimensions.popitem(last=False)
+
+                # Let JPEG decode straight at a reduced scale (no-op for other formats)
+                img.draft('RGB', (size[0] * 2, size[1] * 2))
+                # Rotate camera photos upright using their EXIF orientation
+                img = ImageOps.exif_transpose(img)
                 # Preserve transparency for RGBA/LA/P images
                 if img.mode in ('RGBA', 'LA', 'P'):
                     # Convert P mode to RGBA to preserve transparency
@@ -162,6 +255,46 @@ class FileManager:
             print(f"❌ Error generating thumbnail: {e}")
             return None
 
+    def prune_thumbnails(self, max_files: int = THUMBNAIL_CACHE_LIMIT) -> int:
+        """
+        Delete the least recently used thumbnails beyond max_files
+
+        Thumbnails are named after their source's content, so edited or
+        removed files leave old ones behind that are never reused.
+
+        Args:
+            max_files: Number of thumbnails to keep
+
+        Returns:
+            Number of thumbnails deleted
+        """
+        thumbs = []
+        try:
+            with os.scandir(self.thumbnails_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or not entry.is_file():
+                        continue
+                    try:
+                        thumbs.append((entry.stat().st_mtime_ns, entry.path))
+                    except OSError:
+                        pass
+        except OSError:
+            return 0
+
+        if len(thumbs) <= max_files:
+            return 0
+
+        # Cache hits touch the file, so mtime tracks last use
+        thumbs.sort(reverse=True)
+        removed = 0
+        for _, thumb_path in thumbs[max_files:]:
+            try:
+                os.remove(thumb_path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
     def zip_folder(self, folder_path: str, output_name: Optional[str] = None) -> Optional[Path]:
         """
         Zip a folder for transfer
@@ -327,28 +460,8 @@ class FileManager:
         if ext in self.image_formats:
             return "🖼️"
 
-        # Videos
-        if ext in {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'}:
-            return "🎥"
-
-        # Audio
-        if ext in {'.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a'}:
-            return "🎵"
-
-        # Documents
-        if ext in {'.pdf', '.doc', '.docx', '.txt', '.rtf'}:
-            return "📄"
-
-        # Archives
-        if ext in {'.zip', '.rar', '.7z', '.tar', '.gz'}:
-            return "📦"
-
-        # Code
-        if ext in {'.py', '.js', '.html', '.css', '.java', '.cpp', '.c', '.h'}:
-            return "💻"
-
-        # Default
-        return "📁"
+        # Everything else, with a folder as the default
+        return _EXT_TO_EMOJI.get(ext, "📁")
 
 
 if __name__ == "__main__":
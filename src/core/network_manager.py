@@ -80,8 +80,19 @@ class NetworkManager:
             event: Event name (on_connected, on_disconnected, etc.)
             callback: Function to call when event occurs
         """
-        if event in self.callbacks:
-            self.callbacks[event].append(callback)
+        self.register_callbacks({event: callback})
+
+    def register_callbacks(self, callbacks: Dict[str, Callable]) -> None:
+        """
+        Register several event callbacks at once
+
+        Args:
+            callbacks: Mapping of event name to callback function
+        """
+        with self._lock:
+            for event, callback in callbacks.items():
+                if event in self.callbacks:
+                    self.callbacks[event].append(callback)
 
     def _trigger_callback(self, event: str, *args, **kwargs) -> None:
         """Trigger all callbacks for an event"""
@@ -388,8 +399,10 @@ if __name__ == "__main__":
     def on_disconnected():
         print("❌ Disconnected")
 
-    manager.register_callback('on_connected', on_connected)
-    manager.register_callback('on_disconnected', on_disconnected)
+    manager.register_callbacks({
+        'on_connected': on_connected,
+        'on_disconnected': on_disconnected,
+    })
 
     print(f"📊 Current state: {manager.state.value}")
 
@@ -5,6 +5,7 @@ Handles chunked file transfers with progress tracking, queuing, and retry logic.
 """
 
 import json
+import os
 import struct
 import threading
 import time
@@ -120,8 +121,14 @@ class TransferProtocol:
 
     def register_callback(self, event: str, callback: Callable):
         """Register a callback for an event"""
-        if event in self.callbacks:
-            self.callbacks[event].append(callback)
+        self.register_callbacks({event: callback})
+
+    def register_callbacks(self, callbacks: Dict[str, Callable]):
+        """Register several event callbacks under a single lock acquisition"""
+        with self._lock:
+            for event, callback in callbacks.items():
+                if event in self.callbacks:
+                    self.callbacks[event].append(callback)
 
     def _trigger_callback(self, event: str, *args, **kwargs):
         """Trigger all callbacks for an event"""
@@ -160,12 +167,14 @@ class TransferProtocol:
             Transfer object or None if failed
         """
         try:
-            path = Path(file_path)
-            if not path.exists():
+            # One stat both checks the file exists and gives its size
+            try:
+                file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
                 print(f"⚠️  File not found: {file_path}")
                 return None
 
-            file_size = path.stat().st_size
+            path = Path(file_path)
             file_hash = self.calculate_file_hash(file_path)
             transfer_id = hashlib.md5(
                 f"{file_path}{time.time()}".encode()).hexdigest()
@@ -3,63 +3,272 @@ Main window for SyncStream application
 """
 
 import customtkinter as ctk
+import collections
+import concurrent.futures
+import contextlib
+import copy
+import functools
+import importlib.util
 from pathlib import Path
 import tkinter as tk
 from PIL import Image
 import json
+import logging
+import math
 import os
+import platform
+import queue
+import subprocess
 import sys
+import threading
 from typing import Optional
 import webbrowser
 
 # Import version manager
 from utils.version_manager import VersionManager
+from utils.name_index import NameIndex
+from ui.transfer_view import TransferView
 
+logger = logging.getLogger(__name__)
+
+# Imported up front: the window class derives from TkinterDnD.Tk when present
 try:
     from tkinterdnd2 import DND_FILES, TkinterDnD
     DRAG_DROP_AVAILABLE = True
 except ImportError:
     DRAG_DROP_AVAILABLE = False
-    print("⚠️  tkinterdnd2 not available. Drag & drop will be disabled.")
+    logger.warning("tkinterdnd2 not available. Drag & drop will be disabled.")
 
-try:
-    from win10toast import ToastNotifier
-    NOTIFICATIONS_AVAILABLE = True
-except ImportError:
-    NOTIFICATIONS_AVAILABLE = False
-    print("⚠️  win10toast not available. Notifications will be disabled.")
+# Notifications and the tray are only checked for here, and imported on first use
+NOTIFICATIONS_AVAILABLE = importlib.util.find_spec("win10toast") is not None
+if not NOTIFICATIONS_AVAILABLE:
+    logger.warning("win10toast not available. Notifications will be disabled.")
 
-try:
-    import pystray
-    from pystray import MenuItem as item
-    SYSTRAY_AVAILABLE = True
-except ImportError:
-    SYSTRAY_AVAILABLE = False
-    print("⚠️  pystray not available. System tray will be disabled.")
+SYSTRAY_AVAILABLE = importlib.util.find_spec("pystray") is not None
+if not SYSTRAY_AVAILABLE:
+    logger.warning("pystray not available. System tray will be disabled.")
+
+# Host OS, fixed for the lifetime of the process
+_SYSTEM = platform.system()
 
+# Open a file or folder with the platform's default handler; the opener is
+# started without a shell and not waited on
+if _SYSTEM == 'Windows':
+    _open_path = os.startfile
+else:
+    _OPENER = 'open' if _SYSTEM == 'Darwin' else 'xdg-open'
 
+    def _open_path(path):
+        try:
+            subprocess.Popen([_OPENER, str(path)], start_new_session=True,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except FileNotFoundError:
+            # The opener itself is missing, not the file being opened
+            raise OSError(f"No '{_OPENER}' command available to open files") from None
+
+# Extra gallery rows kept built above and below the viewport
+GALLERY_BUFFER_ROWS = 2
+
+# Widest gallery layout (normal mode); compact mode uses 2 columns
+GALLERY_MAX_COLUMNS = 5
+
+# Tiles hidden by filtering or scrolling that are kept for reuse rather
+# than destroyed; the oldest are destroyed beyond this
+GALLERY_TILE_POOL = 40
+
+# Decoded gallery thumbnails kept in memory, least recently used dropped first
+THUMB_CACHE_LIMIT = 300
+
+# Pixels either side of the compact-mode width a resize must pass to switch
+# modes, so dragging back and forth across the threshold doesn't thrash
+COMPACT_HYSTERESIS_PX = 20
+
+# Theme toggle fade: opacity steps, and the gallery size above which it's skipped
+THEME_FADE_STEPS = 10
+THEME_FADE_MAX_TILES = 100
+
+# Worker-thread UI updates: drained every ~frame, capped per tick
+UI_DRAIN_INTERVAL_MS = 16
+UI_DRAIN_BATCH = 64
+
+# Thumbnail cache format; bump to wipe caches left by older versions on startup
+THUMBNAIL_CACHE_VERSION = "transparency-v1"
+
+# Bindtag carrying the right-click binding shared by all gallery tiles
+FILE_TILE_BINDTAG = "SyncStreamFileTile"
+
+# Transfer notification bodies
+_START_TMPL = "Sending %s..."
+_OK_TMPL = "Successfully sent %s"
+_FAIL_TMPL = "Failed to send %s: %s"
+
+# Extension -> gallery filter category
+_EXT_TO_CATEGORY = {
+    ext: category
+    for category, exts in (
+        ("Images", ('.jpg', '.jpeg', '.png', '.gif',
+                    '.bmp', '.svg', '.webp', '.ico')),
+        ("Documents", ('.txt', '.pdf', '.doc', '.docx', '.xls',
+                       '.xlsx', '.ppt', '.pptx', '.odt', '.rtf')),
+        ("Videos", ('.mp4', '.avi', '.mkv', '.mov',
+                    '.wmv', '.flv', '.webm', '.m4v')),
+        ("Archives", ('.zip', '.rar', '.7z', '.tar', '.gz', '.bz2', '.xz')),
+    )
+    for ext in exts
+}
+
+# Extensions the gallery generates image thumbnails for
+_THUMBNAIL_EXTS = frozenset(
+    ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp', '.ico'))
+
+# Extension -> emoji shown when a file has no thumbnail
+_EXT_TO_EMOJI = {
+    ext: emoji
+    for emoji, exts in (
+        ("🖼️", ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp', '.ico')),
+        ("🎬", ('.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv')),
+        ("🎵", ('.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a')),
+        ("📄", ('.pdf', '.doc', '.docx', '.txt', '.rtf')),
+        ("📊", ('.xls', '.xlsx', '.csv')),
+        ("📦", ('.zip', '.rar', '.7z', '.tar', '.gz')),
+        ("💻", ('.py', '.js', '.java', '.cpp', '.c', '.html', '.css')),
+    )
+    for ext in exts
+}
+
+
+def _parse_file_meta(file_path):
+    """Parse a file path once into the name/suffix/category/emoji the gallery uses"""
+    path = Path(file_path)
+    suffix = path.suffix.lower()
+    name = path.name
+    return {
+        'path': path,
+        'suffix': suffix,
+        'name': name,
+        'name_lower': name.lower(),
+        # Truncated name shown on gallery tiles
+        'display_name': name if len(name) < 20 else name[:17] + "...",
+        'category': _EXT_TO_CATEGORY.get(suffix, "All"),
+        'emoji': _EXT_TO_EMOJI.get(suffix, "📄"),
+    }
+
+
+# PyInstaller unpacks to a temp folder and stores its path in _MEIPASS;
+# in development resources live at the repository root
+_MEIPASS = getattr(sys, '_MEIPASS', None)
+_BASE_PATH = Path(_MEIPASS) if _MEIPASS else Path(__file__).parent.parent.parent
+_ASSETS_DIR = _BASE_PATH / "Assets"
+
+
+@functools.lru_cache(maxsize=64)
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
+    return _BASE_PATH / relative_path
+
+
+@functools.lru_cache(maxsize=None)
+def _asset_path(name):
+    """Path of a bundled asset, or None if it's missing (checked once per name)"""
+    path = _ASSETS_DIR / name
+    return path if path.exists() else None
+
+
+def _read_image_dimensions(file_path):
+    """Read an image's upright pixel size from its header, or None if it can't be read"""
     try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = Path(sys._MEIPASS)
+        with Image.open(file_path) as source:
+            dimensions = source.size
+            if source.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+                dimensions = dimensions[::-1]
+        return dimensions
     except Exception:
-        # Running in development
-        base_path = Path(__file__).parent.parent.parent
+        return None
+
+
+def _shutdown_pool(pool, pending=()):
+    """Stop a worker pool without blocking, cancelling the given jobs that haven't started
+
+    The futures are cancelled here rather than with shutdown(cancel_futures=True),
+    which needs Python 3.9.
+    """
+    for future in list(pending):
+        future.cancel()
+    pool.shutdown(wait=False)
+
+
+def _peer_names(peer_profiles):
+    """Option values for the "Connect to" menu, with a placeholder when empty"""
+    return tuple(p.name for p in peer_profiles or ()) or ("No Peers",)
+
+
+# Parsed JSON files kept between reads: {path: (st_mtime_ns, data)}
+_JSON_CACHE = {}
+
+
+def _read_json_cached(path):
+    """Parse a JSON file, reusing the previous result while its mtime is unchanged
+
+    Callers get their own copy, so changing it never alters the cached data.
+    """
+    path = str(path)
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _JSON_CACHE.get(path)
+    if not cached or cached[0] != mtime_ns:
+        cached = _JSON_CACHE[path] = (mtime_ns, json.loads(Path(path).read_bytes()))
+    return copy.deepcopy(cached[1])
+
+
+def _decode_icon(path, size):
+    """Decode an icon and downsample it close to its display size"""
+    img = Image.open(path)
+    img.draft("RGBA", size)
+    img = img.convert("RGBA")
+    # Keep 2x headroom so HiDPI scaling still has pixels to work with
+    img.thumbnail((size[0] * 2, size[1] * 2), Image.Resampling.LANCZOS)
+    return img
 
-    return base_path / relative_path
+
+@functools.lru_cache(maxsize=32)
+def _load_ctk_image(path, size):
+    """Load an icon as a CTkImage, decoded and downsampled close to its display size
+
+    Cached per (path, size); CTkImages can be shared by any number of widgets.
+    """
+    img = _decode_icon(path, size)
+    return ctk.CTkImage(light_image=img, dark_image=img, size=size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_themed_ctk_image(light_path, dark_path, size):
+    """Load a CTkImage that CTk itself switches between light and dark variants"""
+    return ctk.CTkImage(light_image=_decode_icon(light_path, size),
+                        dark_image=_decode_icon(dark_path, size), size=size)
+
+
+class TransferSlot:
+    """What the UI keeps about an in-flight transfer (not the Transfer itself)"""
+
+    __slots__ = ("file_path", "filename")
+
+    def __init__(self, file_path, filename):
+        self.file_path = file_path
+        self.filename = filename
 
 
 class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
     """Main application window"""
 
-    def __init__(self, theme_manager, network_manager, file_manager):
+    def __init__(self, theme_manager, network_manager=None, file_manager=None):
         super().__init__()
 
-        # Store managers
+        # Store managers; network/file managers not passed in are created on
+        # first use (see the network_manager/file_manager properties)
         self.theme_manager = theme_manager
-        self.network_manager = network_manager
-        self.file_manager = file_manager
+        if network_manager is not None:
+            self.network_manager = network_manager
+        if file_manager is not None:
+            self.file_manager = file_manager
 
         # Initialize config manager
         from core.config_manager import ConfigManager
@@ -69,9 +278,9 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         self.version_manager = VersionManager()
 
         # Set assets path for use throughout the app
-        self.assets_path = get_resource_path("Assets")
+        self.assets_path = _ASSETS_DIR
 
-        # Clear old thumbnails to regenerate with transparency
+        # Clear thumbnails left by an older cache format, or trim old ones
         self._clear_thumbnail_cache()
 
         # Configure window
@@ -94,15 +303,10 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         ctk.set_default_color_theme("green")
         ctk.set_appearance_mode(self.theme_manager.get_ctk_theme_mode())
         # Fix theme background by setting background color to match ThemeManager
+        self._theme_bg_cache = {}  # {theme name: primary background}
         try:
-            theme_bg = self.theme_manager.current_theme.bg_primary
-            # If ThemeManager exposes a name, use it to enforce light-mode white
-            tm_name = getattr(self.theme_manager, 'current_theme_name', None)
-            if tm_name and str(tm_name).lower().startswith('light'):
-                # Ensure light mode background is white
-                theme_bg = '#ffffff'
             # Ensure window background matches theme primary background
-            self.configure(bg=theme_bg)
+            self.configure(bg=self._get_theme_bg())
         except Exception:
             # Fallback to previous handling for TkinterDnD
             if DRAG_DROP_AVAILABLE:
@@ -113,52 +317,111 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
 
         # Use a single app icon (blackp2p.ico) regardless of theme
         try:
-            icon_path = self.assets_path / "blackp2p.ico"
-            if icon_path.exists():
+            icon_path = _asset_path("blackp2p.ico")
+            if icon_path:
                 self.iconbitmap(str(icon_path))
             else:
-                print(f"⚠️  Icon not found: {icon_path}")
+                print(f"⚠️  Icon not found: {_ASSETS_DIR / 'blackp2p.ico'}")
         except Exception as e:
             print(f"⚠️  Failed to load icon: {e}")
 
-        # Initialize notification system
-        if NOTIFICATIONS_AVAILABLE:
-            try:
-                self.toaster = ToastNotifier()
-            except Exception as e:
-                print(f"⚠️  Failed to initialize notifications: {e}")
-                self.toaster = None
-        else:
-            self.toaster = None
-
         # Initialize system tray
         self.tray_icon = None
         if SYSTRAY_AVAILABLE:
             self._setup_system_tray()
 
-        # Load profiles
-        self._load_profiles()
-
         # Initialize connection state
         self.is_connected = False
         self.led_status = "idle"  # idle, connecting, connected
 
         # Initialize shared files list and load from disk
         self.shared_files = []
-        self._load_shared_files()
+        self._shared_files_set = set()  # Same paths, for O(1) membership checks
+        self._file_meta = {}  # {file_path: parsed name/suffix/category/emoji}
+        # Shared files bucketed by gallery filter ('All' is shared_files itself)
+        self._files_by_category = {
+            'All': self.shared_files,
+            'Images': [],
+            'Documents': [],
+            'Videos': [],
+            'Archives': [],
+        }
+        self._name_index = NameIndex()  # Substring search over file names
+        # Saved files are checked on a worker; don't save over them until merged
+        self._shared_files_loaded = False
+        self._saved_shared_files = ()  # List as last read from / written to disk
+        self._shared_files_path = (
+            Path(os.path.expanduser("~")) / ".syncstream" / "shared_files.json")
 
         # Standard button style to use across the UI (keep consistent)
         self.btn_width = 90
         self.btn_font = ("Arial", 14, "bold")
 
-        # Track active transfers
+        # Track active transfers: {transfer_id: TransferSlot}
         self.active_transfers = {}
+        # Delayed post-transfer tile resets: {file_path: [after id, ...]}
+        self._pending_afters = collections.defaultdict(list)
+
+        # Latest not-yet-shown progress per transfer: {transfer_id: (transfer, percent)}
+        self._pending_progress = {}
+        self._progress_flush_scheduled = False
+
+        # Transfer UI updates posted from worker threads, drained by a UI tick
+        self._ui_q = queue.SimpleQueue()
+        self._ui_lock = threading.Lock()
 
         # Track file widgets for progress updates
-        self.file_widgets = {}  # {file_path: {"frame": frame, "progress": progress_bar}}
+        self.file_widgets = {}  # {file_path: {"frame": frame, "view": TransferView, ...}}
+
+        # Gallery virtualization state: filtered file list and built rows
+        self._gallery_files = []
+        self._gallery_row_count = 0
+        self._gallery_window = None  # (first_row, last_row) currently built
+        self._gallery_layout = None  # (compact, connected) tiles were built for
+        self._gallery_empty_label = None
+        self._hidden_tiles = collections.OrderedDict()  # {file_path: None}, oldest first
+        self._gallery_search = ""  # Search text the gallery is showing results for
+        self._gallery_filter = None  # Category the gallery is showing
+        self._gallery_dirty = False  # Files changed while the gallery was hidden
+        self._layout_batching = False  # Inside _layout_batch(); it flushes layout itself
+        self._tile_paths = {}  # {tile frame widget path: file_path}
+        self._tile_commands = {}  # {file_path: {handler name: command}}
+        self._gallery_refresh_id = None
+
+        # Gallery thumbnails already loaded this session, and the pool that
+        # generates new ones off the UI thread
+        # {(file_path, mtime_ns, size, thumb_size): CTkImage}, oldest first
+        self._thumb_cache = collections.OrderedDict()
+        self._thumb_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="thumbnail")
+        self._thumb_jobs = {}  # {cache key: future} for jobs queued or running
+
+        # Toast notifications are shown from a single background worker
+        self._notify_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="notify")
+        self._notify_jobs = []  # Toasts not yet shown, cancelled on quit
+
+        # Outgoing file sends share the one peer socket, so a single worker
+        # sends them in turn rather than interleaving them on the wire
+        self._send_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="xfer")
+
+        # Pending debounced search filter
+        self._filter_after_id = None
+
+        # Pending debounced resize handling, and the state it last acted on
+        self._resize_after_id = None
+        self._last_resize_state = None
+        self._last_resize_width = 0  # Width from the latest <Configure> event
+        self._screen_width = self.winfo_screenwidth()
+
+        # True while the theme toggle fade animation is running
+        self._theme_fading = False
 
         # Track drag-drop state
         self.is_dragging = False
+        self._drag_tint_shown = False  # Whether the drag tint is currently applied
+        self._drag_tint_after_id = None
         self.original_window_fg = None
 
         # Track view states
@@ -167,28 +430,27 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         self.settings_visible = False
         self.profile_manager_visible = False
 
+        # Main UI widgets, None until _build_ui creates them (e.g. during onboarding)
+        self.main_frame = None
+        self.top_frame = None
+        self.top_frame_rounded_bottom = None
+        self.bottom_bar = None
+        self.content_frame = None
+        self.content_frame_original_fg = None
+        self.drop_label = None
+        self.gallery_frame = None
+        self.gallery_btn = None
+        self.search_entry = None
+        self.filter_btn = None
+        self._theme_icon = None  # Theme button image, when its icons exist
+
         # Save files on close
         self.protocol("WM_DELETE_WINDOW", self._on_window_close)
 
-        # Register network callbacks
-        self.network_manager.register_callback(
-            'on_connecting', self._on_connecting)
-        self.network_manager.register_callback(
-            'on_connected', self._on_connected)
-        self.network_manager.register_callback(
-            'on_disconnected', self._on_disconnected)
-        self.network_manager.register_callback(
-            'on_connection_error', self._on_connection_error)
-
-        # Register transfer protocol callbacks
-        self.network_manager.transfer_protocol.register_callback(
-            'on_transfer_start', self._on_transfer_start)
-        self.network_manager.transfer_protocol.register_callback(
-            'on_transfer_progress', self._on_transfer_progress)
-        self.network_manager.transfer_protocol.register_callback(
-            'on_transfer_complete', self._on_transfer_complete)
-        self.network_manager.transfer_protocol.register_callback(
-            'on_transfer_error', self._on_transfer_error)
+        # Register callbacks on an injected network manager now; a lazily
+        # created one registers them itself
+        if network_manager is not None:
+            self._register_network_callbacks(network_manager)
 
         # Track compact mode state (must be before _build_ui)
         self.is_compact_mode = False
@@ -211,34 +473,94 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         if not self.showing_onboarding:
             self.bind("<Configure>", self._on_window_resize)
 
-    def _load_profiles(self):
-        """Load profile information from config"""
+        # Start draining UI updates queued by worker threads
+        self._drain_ui_queue()
+
+        # Read saved shared files now the UI queue exists to hand them back
+        self._load_shared_files()
+
+    @functools.cached_property
+    def network_manager(self):
+        """Network manager, created and wired up on first use"""
+        from core.network_manager import NetworkManager
+        network_manager = NetworkManager()
+        self._register_network_callbacks(network_manager)
+        return network_manager
+
+    @functools.cached_property
+    def file_manager(self):
+        """File manager, created on first use"""
+        from core.file_manager import FileManager
+        return FileManager(_app_data_dir())
+
+    @functools.cached_property
+    def toaster(self):
+        """Toast notifier, created when the first notification is shown"""
+        if not NOTIFICATIONS_AVAILABLE:
+            return None
+        try:
+            from win10toast import ToastNotifier
+            return ToastNotifier()
+        except Exception as e:
+            print(f"⚠️  Failed to initialize notifications: {e}")
+            return None
+
+    def _register_network_callbacks(self, network_manager):
+        """Register the window's connection and transfer callbacks"""
+        # Register network callbacks
+        network_manager.register_callbacks({
+            'on_connecting': self._on_connecting,
+            'on_connected': self._on_connected,
+            'on_disconnected': self._on_disconnected,
+            'on_connection_error': self._on_connection_error,
+        })
+
+        # Register transfer protocol callbacks
+        network_manager.transfer_protocol.register_callbacks({
+            'on_transfer_start': self._on_transfer_start,
+            'on_transfer_progress': self._on_transfer_progress,
+            'on_transfer_complete': self._on_transfer_complete,
+            'on_transfer_error': self._on_transfer_error,
+        })
+
+    @functools.cached_property
+    def profiles(self):
+        """Profile information from config, read on first access"""
         try:
             config_path = get_resource_path("config") / "settings.json"
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
-                    self.profiles = config.get("profiles", {})
-            else:
-                # Default profiles
-                self.profiles = {
-                    "Majid": {"ip": "100.93.161.73", "port": 5000},
-                    "Majid 2.0": {"ip": "100.92.141.68", "port": 5000},
-                    "Nathan": {"ip": "100.122.120.65", "port": 5000}
-                }
+            config = _read_json_cached(config_path)
+            return config.get("profiles", {})
+        except FileNotFoundError:
+            # Default profiles
+            return {
+                "Majid": {"ip": "100.93.161.73", "port": 5000},
+                "Majid 2.0": {"ip": "100.92.141.68", "port": 5000},
+                "Nathan": {"ip": "100.122.120.65", "port": 5000}
+            }
         except Exception as e:
             print(f"⚠️  Failed to load profiles: {e}")
-            self.profiles = {}
+            return {}
 
     def _clear_thumbnail_cache(self):
-        """Clear thumbnail cache to force regeneration with transparency"""
+        """Clear the thumbnail cache if it was written by an older cache format, else prune it"""
         try:
-            import shutil
             thumb_dir = self.file_manager.thumbnails_dir
+            marker = thumb_dir / ".cache_version"
+            try:
+                if marker.read_text(encoding="utf-8") == THUMBNAIL_CACHE_VERSION:
+                    removed = self.file_manager.prune_thumbnails()
+                    if removed:
+                        print(f"🗑️  Removed {removed} old thumbnails")
+                    return
+            except FileNotFoundError:
+                pass
+
+            import shutil
             if thumb_dir.exists():
                 shutil.rmtree(thumb_dir)
-                thumb_dir.mkdir(parents=True, exist_ok=True)
                 print("🗑️  Cleared thumbnail cache")
+            thumb_dir.mkdir(parents=True, exist_ok=True)
+            marker.write_text(THUMBNAIL_CACHE_VERSION, encoding="utf-8")
         except Exception as e:
             print(f"⚠️  Failed to clear thumbnail cache: {e}")
 
@@ -572,43 +894,102 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
                     self.my_profile_selector.configure(values=["No Profile"])
                     self.my_profile_selector.set("No Profile")
 
-                # Update Connect to dropdown (shows peer profiles)
-                if peer_profiles and len(peer_profiles) > 0:
-                    peer_names = [p.name for p in peer_profiles]
+                # Update Connect to dropdown (shows peer profiles); setting
+                # values rebuilds the whole menu, so skip it when unchanged
+                peer_names = _peer_names(peer_profiles)
+                if peer_names != self._peer_menu_values:
                     self.peer_profile_selector.configure(values=peer_names)
-                    self.peer_profile_selector.set(peer_names[0])
+                    self._peer_menu_values = peer_names
+                self.peer_profile_selector.set(peer_names[0])
+                if peer_profiles:
                     self.peer_profile_var.set(peer_names[0])
-                else:
-                    self.peer_profile_selector.configure(values=["No Peers"])
-                    self.peer_profile_selector.set("No Peers")
         except Exception as e:
             print(f"⚠️  Failed to refresh profiles: {e}")
 
     def _load_shared_files(self):
-        """Load shared files from persistent storage"""
+        """Load shared files from persistent storage without blocking the window"""
+        threading.Thread(target=self._load_shared_files_async,
+                         name="shared-files", daemon=True).start()
+
+    def _load_shared_files_async(self):
+        """Read the saved list and keep the files that still exist (worker thread)"""
+        saved = ()
+        file_paths = []
         try:
-            config_path = os.path.join(os.path.expanduser(
-                "~"), ".syncstream", "shared_files.json")
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    file_paths = json.load(f)
-                    # Only add files that still exist
-                    for path in file_paths:
-                        if os.path.exists(path) and path not in self.shared_files:
-                            self.shared_files.append(path)
-                    print(f"✅ Loaded {len(self.shared_files)} shared files")
+            saved = tuple(_read_json_cached(self._shared_files_path))
+            # Only add files that still exist (may be slow on network paths)
+            file_paths = [path for path in saved if os.path.exists(path)]
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"⚠️  Failed to load shared files: {e}")
+        finally:
+            # Always hand back, or saving stays disabled for the session
+            self._enqueue_ui(functools.partial(
+                self._apply_loaded_shared_files, file_paths, saved))
+
+    def _apply_loaded_shared_files(self, file_paths, saved=()):
+        """Merge the saved shared files found by the loader into the gallery"""
+        self._saved_shared_files = saved
+        for path in file_paths:
+            self._add_shared(path)
+        self._shared_files_loaded = True
+        print(f"✅ Loaded {len(file_paths)} shared files")
+
+        if file_paths:
+            self._load_file_gallery()
+
+    def _add_shared(self, file_path):
+        """Share a file unless it already is; returns whether it was added"""
+        if file_path in self._shared_files_set:
+            return False
+        self.shared_files.append(file_path)
+        self._shared_files_set.add(file_path)
+        self._index_shared_file(file_path)
+        return True
+
+    def _index_shared_file(self, file_path):
+        """Parse a newly shared file's path once and file it under its category"""
+        meta = self._file_meta[file_path] = _parse_file_meta(file_path)
+        category = meta['category']
+        if category != "All":
+            self._files_by_category[category].append(file_path)
+        self._name_index.add(file_path, meta['name'])
+
+    def _meta(self, file_path):
+        """Cached metadata for a shared file, parsed on the spot for any other path"""
+        meta = self._file_meta.get(file_path)
+        return meta if meta is not None else _parse_file_meta(file_path)
+
+    def _unindex_shared_file(self, file_path):
+        """Drop a removed file's cached metadata and category entry"""
+        meta = self._file_meta.pop(file_path, None)
+        if meta and meta['category'] != "All":
+            self._files_by_category[meta['category']].remove(file_path)
+        self._name_index.remove(file_path)
+        self._tile_commands.pop(file_path, None)
+        # Delayed tile resets for a removed file have nothing left to do
+        for after_id in self._pending_afters.pop(file_path, []):
+            self.after_cancel(after_id)
 
     def _save_shared_files(self):
         """Save shared files to persistent storage"""
+        if not self._shared_files_loaded:
+            # Closed before the saved list was read back; keep it as it is
+            return
+        shared = tuple(self.shared_files)
+        if shared == self._saved_shared_files:
+            return
         try:
-            config_dir = os.path.join(os.path.expanduser("~"), ".syncstream")
-            os.makedirs(config_dir, exist_ok=True)
-            config_path = os.path.join(config_dir, "shared_files.json")
-
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.shared_files, f, indent=2)
+            config_path = self._shared_files_path
+            config_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write a sibling and swap it in so a crash can't leave a torn file
+            tmp_path = config_path.with_suffix(".json.tmp")
+            tmp_path.write_text(
+                json.dumps(self.shared_files, indent=2), encoding='utf-8')
+            os.replace(tmp_path, config_path)
+            self._saved_shared_files = shared
             print(f"✅ Saved {len(self.shared_files)} shared files")
         except Exception as e:
             print(f"⚠️  Failed to save shared files: {e}")
@@ -619,27 +1000,30 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         self._save_shared_files()
 
         # If system tray is available, minimize to tray instead of closing
-        if hasattr(self, 'tray_icon') and self.tray_icon:
+        if self.tray_icon:
             self.withdraw()  # Hide window
-            if self.toaster:
+            if NOTIFICATIONS_AVAILABLE:
                 self._show_notification(
                     "SyncStream",
                     "App minimized to system tray"
                 )
         else:
-            # Shutdown network manager
-            if self.network_manager:
-                self.network_manager.shutdown()
+            # Shutdown network manager (if it was ever started)
+            network_manager = self.__dict__.get('network_manager')
+            if network_manager:
+                network_manager.shutdown()
+            self._shutdown_pools()
             self.destroy()
 
-    def _build_ui(self):
-        """Build the main UI"""
-        # Create a container frame with theme background so the app matches theme
+    def _get_theme_bg(self):
+        """Primary background for the current theme (pure white in light mode)"""
+        tm_name = getattr(self.theme_manager, 'current_theme_name', None)
+        theme_bg = self._theme_bg_cache.get(tm_name)
+        if theme_bg is not None:
+            return theme_bg
+
         try:
-            # Prefer ThemeManager's primary bg when available
             theme_bg = self.theme_manager.current_theme.bg_primary
-            # If ThemeManager exposes a name, use it to enforce light-mode white
-            tm_name = getattr(self.theme_manager, 'current_theme_name', None)
             if tm_name and str(tm_name).lower().startswith('light'):
                 # Ensure light mode background is white (avoid stray dark defaults)
                 theme_bg = '#ffffff'
@@ -656,6 +1040,14 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
             except Exception:
                 theme_bg = '#121212'
 
+        self._theme_bg_cache[tm_name] = theme_bg
+        return theme_bg
+
+    def _build_ui(self):
+        """Build the main UI"""
+        # Create a container frame with theme background so the app matches theme
+        theme_bg = self._get_theme_bg()
+
         # Use the theme primary background for the main container so "transparent"
         # child frames render over the correct background instead of CTk's default
         container = ctk.CTkFrame(self, fg_color=theme_bg, corner_radius=0)
@@ -751,12 +1143,10 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         connect_label.grid(row=0, column=3, padx=(0, 5), sticky="w")
 
         # Peer Profile selector (shows peer profiles to connect to)
-        peer_profiles = self.config_manager.get_profiles()
-        peer_names = [p.name for p in peer_profiles] if peer_profiles else [
-            "No Peers"]
-        peer_default = peer_names[0] if peer_names else "No Peers"
+        peer_names = self._peer_menu_values = _peer_names(
+            self.config_manager.get_profiles())
 
-        self.peer_profile_var = ctk.StringVar(value=peer_default)
+        self.peer_profile_var = ctk.StringVar(value=peer_names[0])
         self.peer_profile_selector = ctk.CTkOptionMenu(
             inner_top,
             variable=self.peer_profile_var,
@@ -770,14 +1160,8 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
 
         # Add Profile button with icon
         try:
-            addprofile_icon_path = Path(
-                __file__).parent.parent.parent / "Assets" / "addprofile.png"
-            if addprofile_icon_path.exists():
-                addprofile_icon = ctk.CTkImage(
-                    light_image=Image.open(addprofile_icon_path),
-                    dark_image=Image.open(addprofile_icon_path),
-                    size=(24, 24)
-                )
+            addprofile_icon = self._icon("addprofile.png")
+            if addprofile_icon:
                 self.add_profile_btn = ctk.CTkButton(
                     inner_top,
                     image=addprofile_icon,
@@ -818,14 +1202,8 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
 
         # Statistics button with icon
         try:
-            stats_icon_path = Path(
-                __file__).parent.parent.parent / "Assets" / "stats.png"
-            if stats_icon_path.exists():
-                stats_icon = ctk.CTkImage(
-                    light_image=Image.open(stats_icon_path),
-                    dark_image=Image.open(stats_icon_path),
-                    size=(24, 24)
-                )
+            stats_icon = self._icon("stats.png")
+            if stats_icon:
                 self.stats_btn = ctk.CTkButton(
                     inner_top,
                     image=stats_icon,
@@ -866,14 +1244,8 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
 
         # Settings button with icon
         try:
-            settings_icon_path = Path(
-                __file__).parent.parent.parent / "Assets" / "settings.png"
-            if settings_icon_path.exists():
-                settings_icon = ctk.CTkImage(
-                    light_image=Image.open(settings_icon_path),
-                    dark_image=Image.open(settings_icon_path),
-                    size=(24, 24)
-                )
+            settings_icon = self._icon("settings.png")
+            if settings_icon:
                 self.settings_btn = ctk.CTkButton(
                     inner_top,
                     image=settings_icon,
@@ -928,16 +1300,16 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
             frame_colors = self.theme_manager.get_frame_colors()
             top_fg = frame_colors.get("fg_color", None)
             top_border = frame_colors.get("border_color", None)
-            if hasattr(self, 'top_frame') and self.top_frame:
+            if self.top_frame is not None:
                 self.top_frame.configure(
                     fg_color=top_fg, border_color=top_border)
 
             # Update the rounded bottom overlay too
-            if hasattr(self, 'top_frame_rounded_bottom') and self.top_frame_rounded_bottom:
+            if self.top_frame_rounded_bottom is not None:
                 self.top_frame_rounded_bottom.configure(fg_color=top_fg)
 
             # bottom bar too
-            if hasattr(self, 'bottom_bar') and self.bottom_bar:
+            if self.bottom_bar is not None:
                 self.bottom_bar.configure(
                     fg_color=top_fg, border_color=top_border)
         except Exception as e:
@@ -945,22 +1317,8 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
 
     def _build_main_content(self, parent):
         """Build the main content area"""
-        # Determine theme background for content area (fallback if needed)
-        try:
-            theme_bg = self.theme_manager.current_theme.bg_primary
-            # If ThemeManager exposes a name, use it to enforce light-mode white
-            tm_name = getattr(self.theme_manager, 'current_theme_name', None)
-            if tm_name and str(tm_name).lower().startswith('light'):
-                # Ensure light mode background is white
-                theme_bg = '#ffffff'
-        except Exception:
-            theme_bg = None
-        if not theme_bg:
-            try:
-                mode = self.theme_manager.current_theme_name
-            except Exception:
-                mode = 'dark'
-            theme_bg = '#ffffff' if mode == 'light' else '#121212'
+        # Determine theme background for content area
+        theme_bg = self._get_theme_bg()
 
         main_frame = ctk.CTkFrame(parent, fg_color=theme_bg)
         main_frame.grid(row=1, column=0, sticky="nsew", padx=0, pady=0)
@@ -989,18 +1347,12 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         # Store original colors for hover effect
         self.content_frame_original_fg = self.content_frame.cget("fg_color")
 
-        # Drag and drop zone - upload icon
+        # Drag and drop zone - upload icon (both theme variants kept for toggling)
         try:
-            icon_name = "whiteupload.png" if self.theme_manager.current_theme_name == "dark" else "blackupload.png"
-            icon_path = Path(__file__).parent.parent.parent / \
-                "Assets" / icon_name
-
-            if icon_path.exists():
-                upload_image = ctk.CTkImage(
-                    light_image=Image.open(icon_path),
-                    dark_image=Image.open(icon_path),
-                    size=(64, 64)
-                )
+            upload_image = self._load_theme_icon(
+                light="blackupload.png", dark="whiteupload.png", size=(64, 64))
+
+            if upload_image:
                 self.drop_icon = ctk.CTkLabel(
                     self.content_frame,
                     text="",
@@ -1045,38 +1397,38 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         self.current_filter = "All"  # All, Images, Documents, Videos, Archives
 
         # Get proper theme background color
-        try:
-            gallery_bg = self.theme_manager.current_theme.bg_primary
-            # If ThemeManager exposes a name, use it to enforce light-mode white
-            tm_name = getattr(self.theme_manager, 'current_theme_name', None)
-            if tm_name and str(tm_name).lower().startswith('light'):
-                # Ensure light mode background is white
-                gallery_bg = '#ffffff'
-        except Exception:
-            # Fallback to CTk appearance mode
-            try:
-                app_mode = ctk.get_appearance_mode()
-                if app_mode and str(app_mode).lower().startswith('light'):
-                    gallery_bg = '#ffffff'
-                else:
-                    gallery_bg = self.theme_manager.current_theme.bg_primary
-            except Exception:
-                gallery_bg = self.theme_manager.current_theme.bg_primary
+        gallery_bg = self._get_theme_bg()
 
         self.gallery_frame = ctk.CTkScrollableFrame(
             self.content_frame,
             label_text="",
             fg_color=gallery_bg
         )
-        # Don't grid it yet - will be shown on toggle
+        # Set its grid options once and hide it; toggles just grid()/grid_remove()
+        self.gallery_frame.grid(
+            row=3, column=0, sticky="nsew", padx=10, pady=10)
+        self.gallery_frame.grid_remove()
 
-        # Configure gallery grid
-        for i in range(4):
-            self.gallery_frame.grid_columnconfigure(i, weight=1)
+        # Gallery grid columns are configured per mode in _load_file_gallery
 
         # Bind mousewheel for row-based scrolling
         self._bind_gallery_scroll()
 
+        # One right-click binding shared by every gallery tile
+        self.bind_class(FILE_TILE_BINDTAG, "<Button-3>",
+                        self._on_file_tile_right_click)
+
+        # Realize gallery tiles as the viewport scrolls or resizes
+        gallery_canvas = self.gallery_frame._parent_canvas
+        gallery_scrollbar_set = self.gallery_frame._scrollbar.set
+
+        def on_gallery_yscroll(first, last):
+            gallery_scrollbar_set(first, last)
+            self._schedule_gallery_refresh()
+        gallery_canvas.configure(yscrollcommand=on_gallery_yscroll)
+        gallery_canvas.bind(
+            "<Configure>", self._schedule_gallery_refresh, add="+")
+
         # Statistics page (hidden by default)
         self.statistics_frame = ctk.CTkScrollableFrame(
             self.content_frame,
@@ -1159,7 +1511,7 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
 
         # Search box (hidden by default, shown when gallery is visible)
         self.search_var = ctk.StringVar()
-        self.search_var.trace("w", lambda *args: self._filter_gallery())
+        self.search_var.trace_add("write", lambda *args: self._filter_gallery())
         self.search_entry = ctk.CTkEntry(
             inner_bottom,
             placeholder_text="Search here...",
@@ -1168,7 +1520,9 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
             font=("Arial", 11),
             fg_color="transparent"
         )
-        # Don't grid it yet - will be shown when gallery is visible (column 1)
+        # Hidden until the gallery is shown; grid options are set once here
+        self.search_entry.grid(row=0, column=1, padx=8, sticky="w")
+        self.search_entry.grid_remove()
 
         # Filter button (hidden by default, shown when gallery is visible)
         self.filter_btn = ctk.CTkButton(
@@ -1178,7 +1532,9 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
             command=self._cycle_filter,
             font=self.btn_font
         )
-        # Don't grid it yet - will be shown when gallery is visible (column 2)
+        # Hidden until the gallery is shown; grid options are set once here
+        self.filter_btn.grid(row=0, column=2, padx=(0, 8), sticky="w")
+        self.filter_btn.grid_remove()
 
         # Create a container frame for right-aligned buttons (Connect, Status LED, Theme)
         right_buttons_frame = ctk.CTkFrame(
@@ -1192,16 +1548,10 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         right_buttons_frame.grid_columnconfigure(3, weight=0)  # Theme
 
         try:
-            icon_name = "sun.png" if self.theme_manager.current_theme_name == "dark" else "moon.png"
-            icon_path = Path(__file__).parent.parent.parent / \
-                "Assets" / icon_name
-
-            if icon_path.exists():
-                icon_image = ctk.CTkImage(
-                    light_image=Image.open(icon_path),
-                    dark_image=Image.open(icon_path),
-                    size=(24, 24)
-                )
+            icon_image = self._theme_icon = self._load_theme_icon(
+                light="moon.png", dark="sun.png", size=(24, 24))
+
+            if icon_image:
                 # Keep theme toggle but match button sizing/style - smaller width
                 self.theme_btn = ctk.CTkButton(
                     right_buttons_frame,
@@ -1260,16 +1610,9 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         # Size toggle button (compact/normal mode toggle) with up/down icons
         try:
             # Start with down icon (for compact mode)
-            icon_name = "down.png"
-            icon_path = Path(__file__).parent.parent.parent / \
-                "Assets" / icon_name
-
-            if icon_path.exists():
-                size_icon_image = ctk.CTkImage(
-                    light_image=Image.open(icon_path),
-                    dark_image=Image.open(icon_path),
-                    size=(24, 24)
-                )
+            size_icon_image = self._icon("down.png")
+
+            if size_icon_image:
                 self.size_btn = ctk.CTkButton(
                     right_buttons_frame,
                     text="",
@@ -1310,8 +1653,15 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         # Theme toggle (already created above)
         self.theme_btn.grid(row=0, column=3, padx=(0, 0))
 
-        # Load file gallery
-        self._load_file_gallery()
+        # The gallery starts hidden; it's built when first shown
+
+    def _load_theme_icon(self, light, dark, size):
+        """Load an icon whose light/dark variants follow the appearance mode, or None"""
+        light_path = _asset_path(light)
+        dark_path = _asset_path(dark)
+        if light_path and dark_path:
+            return _load_themed_ctk_image(light_path, dark_path, size)
+        return None
 
     def _bind_gallery_scroll(self):
         """Bind mousewheel events for row-based scrolling in gallery"""
@@ -1374,55 +1724,70 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
 
     def _handle_drag_enter(self, event):
         """Handle drag enter - tint window to opposite theme color"""
-        try:
-            if self.is_dragging:
-                return
-
-            self.is_dragging = True
-
-            # Get opposite theme color for tinting
-            if self.theme_manager.current_theme_name == "dark":
-                # In dark mode, tint to light color (bluish-white)
-                tint_color = "#E8F4FF"  # Light blue tint
-            else:
-                # In light mode, tint to dark color (dark blue)
-                tint_color = "#1a2332"  # Dark blue tint
-
-            # Only tint the content frame (not root window)
-            if hasattr(self, 'content_frame'):
-                self.content_frame.configure(fg_color=tint_color)
-
-            # Show a visual indicator
-            if hasattr(self, 'drop_label'):
-                self.drop_label.configure(
-                    text="📥 Drop files here to share",
-                    font=("Arial", 24, "bold")
-                )
-
-            print("📥 Drag detected - window tinted")
-        except Exception as e:
-            print(f"⚠️  Drag enter effect failed: {e}")
+        if self.is_dragging:
+            return
+        self.is_dragging = True
+        self._schedule_drag_tint()
 
     def _handle_drag_leave(self, event):
         """Handle drag leave - restore original colors"""
-        try:
-            self.is_dragging = False
+        self.is_dragging = False
+        self._schedule_drag_tint()
+
+    def _schedule_drag_tint(self):
+        """Restyle for the drag state once Tk is idle, keeping DnD callbacks cheap"""
+        if self._drag_tint_after_id is None:
+            self._drag_tint_after_id = self.after_idle(self._apply_drag_tint)
+
+    def _apply_drag_tint(self):
+        """Tint the content area while a drag is over the window, or restore it"""
+        self._drag_tint_after_id = None
+        # Enter/leave pairs that cancel out before Tk went idle need no redraw
+        if self.is_dragging == self._drag_tint_shown:
+            return
+        self._drag_tint_shown = self.is_dragging
 
-            # Restore content frame original color
-            if hasattr(self, 'content_frame_original_fg'):
-                self.content_frame.configure(
-                    fg_color=self.content_frame_original_fg)
+        if self.is_dragging:
+            try:
+                # Get opposite theme color for tinting
+                if self.theme_manager.current_theme_name == "dark":
+                    # In dark mode, tint to light color (bluish-white)
+                    tint_color = "#E8F4FF"  # Light blue tint
+                else:
+                    # In light mode, tint to dark color (dark blue)
+                    tint_color = "#1a2332"  # Dark blue tint
+
+                # Only tint the content frame (not root window)
+                if self.content_frame is not None:
+                    self.content_frame.configure(fg_color=tint_color)
+
+                # Show a visual indicator
+                if self.drop_label is not None:
+                    self.drop_label.configure(
+                        text="📥 Drop files here to share",
+                        font=("Arial", 24, "bold")
+                    )
 
-            # Restore drop label
-            if hasattr(self, 'drop_label'):
-                self.drop_label.configure(
-                    text="Drag & Drop Files Here",
-                    font=("Arial", 16)
-                )
+                print("📥 Drag detected - window tinted")
+            except Exception as e:
+                print(f"⚠️  Drag enter effect failed: {e}")
+        else:
+            try:
+                # Restore content frame original color
+                if self.content_frame_original_fg is not None:
+                    self.content_frame.configure(
+                        fg_color=self.content_frame_original_fg)
+
+                # Restore drop label
+                if self.drop_label is not None:
+                    self.drop_label.configure(
+                        text="Drag & Drop Files Here",
+                        font=("Arial", 16)
+                    )
 
-            print("📤 Drag left - colors restored")
-        except Exception as e:
-            print(f"⚠️  Drag leave effect failed: {e}")
+                print("📤 Drag left - colors restored")
+            except Exception as e:
+                print(f"⚠️  Drag leave effect failed: {e}")
 
     def _on_window_resize(self, event):
         """Handle window resize event to switch between normal and compact modes"""
@@ -1434,32 +1799,52 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         if self.manual_size_override:
             return
 
-        try:
-            window_width = self.winfo_width()
-            screen_width = self.winfo_screenwidth()
+        # Moves, height-only resizes and child reflows leave the width as it was
+        if event.width == self._last_resize_width:
+            return
 
-            # Calculate percentage of screen width
-            width_percentage = (window_width / screen_width) * 100
+        # A resize drag fires this for every pixel; act once it settles
+        self._last_resize_width = event.width
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(80, self._apply_resize)
 
-            # Check if we need to switch modes
-            should_be_compact = window_width < self.compact_threshold_width or width_percentage < 30
+    def _apply_resize(self):
+        """Switch modes and adjust the top bar for the settled window width"""
+        self._resize_after_id = None
+        try:
+            window_width = self._last_resize_width
+            # Moves and height-only resizes leave nothing to recompute
+            state = (window_width, self.is_compact_mode, self.gallery_visible)
+            if state == self._last_resize_state:
+                return
 
-            if should_be_compact and not self.is_compact_mode:
+            # Compact below the threshold width or 30% of the screen width,
+            # with a hysteresis band either side of it
+            min_normal_width = max(self.compact_threshold_width,
+                                   self._screen_width * 0.30)
+
+            if (not self.is_compact_mode
+                    and window_width < min_normal_width - COMPACT_HYSTERESIS_PX):
                 self._switch_to_compact_mode()
-            elif not should_be_compact and self.is_compact_mode:
+            elif (self.is_compact_mode
+                    and window_width > min_normal_width + COMPACT_HYSTERESIS_PX):
                 self._switch_to_normal_mode()
 
             # Manage search/filter visibility based on window width even when not switching modes
-            if self.gallery_visible and hasattr(self, 'search_entry') and hasattr(self, 'filter_btn'):
+            if (self.gallery_visible and self.search_entry is not None
+                    and self.filter_btn is not None):
                 if window_width < 600:
                     # Hide search and filter if window is too narrow
                     self.search_entry.grid_remove()
                     self.filter_btn.grid_remove()
                 elif not self.is_compact_mode:
                     # Show search and filter if window is wide enough and not in compact mode
-                    self.search_entry.grid(row=0, column=1, padx=8, sticky="w")
-                    self.filter_btn.grid(
-                        row=0, column=2, padx=(0, 8), sticky="w")
+                    self.search_entry.grid()
+                    self.filter_btn.grid()
+
+            self._last_resize_state = (
+                window_width, self.is_compact_mode, self.gallery_visible)
         except Exception as e:
             print(f"⚠️  Window resize handler error: {e}")
 
@@ -1492,134 +1877,156 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         except Exception as e:
             print(f"⚠️  Size toggle error: {e}")
 
+    def _icon(self, name, size=(24, 24)):
+        """Shared CTkImage for a bundled icon, or None if the asset is missing"""
+        path = _asset_path(name)
+        return _load_ctk_image(path, size) if path else None
+
     def _update_size_button_icon(self, icon_name):
         """Update the size button icon"""
         try:
-            icon_path = Path(__file__).parent.parent.parent / \
-                "Assets" / icon_name
-            if icon_path.exists():
-                new_icon = ctk.CTkImage(
-                    light_image=Image.open(icon_path),
-                    dark_image=Image.open(icon_path),
-                    size=(24, 24)
-                )
-                self.size_btn.configure(image=new_icon)
+            icon = self._icon(icon_name)
+            if icon:
+                self.size_btn.configure(image=icon)
         except Exception as e:
             print(f"⚠️  Failed to update size icon: {e}")
 
+    @contextlib.contextmanager
+    def _layout_batch(self):
+        """Hold geometry propagation while re-gridding, then lay out once"""
+        frames = [f for f in (self.main_frame, self.content_frame) if f is not None]
+        for frame in frames:
+            frame.grid_propagate(False)
+        self._layout_batching = True
+        try:
+            yield
+        finally:
+            self._layout_batching = False
+            # One layout pass for every grid()/grid_remove() made in the batch
+            self.update_idletasks()
+            for frame in frames:
+                frame.grid_propagate(True)
+
     def _switch_to_compact_mode(self):
         """Switch to compact mode - minimal UI"""
         try:
-            self.is_compact_mode = True
-            print("📱 Switching to compact mode")
+            with self._layout_batch():
+                self._apply_compact_layout()
+        except Exception as e:
+            print(f"⚠️  Failed to switch to compact mode: {e}")
 
-            # Set compact window size (only if window is visible) - 380x295
-            if self.winfo_viewable():
-                self.geometry("380x295")
+    def _apply_compact_layout(self):
+        """Hide the top bar, search and filter for compact mode"""
+        self.is_compact_mode = True
+        print("📱 Switching to compact mode")
 
-            # Hide top bar (profile selectors)
-            if hasattr(self, 'top_frame') and self.top_frame:
-                self.top_frame.grid_remove()
+        # Set compact window size (only if window is visible) - 380x295
+        if self.winfo_viewable():
+            self.geometry("380x295")
 
-            # Keep gallery visible if it's already showing, but hide search and filter
-            if hasattr(self, 'gallery_visible') and self.gallery_visible:
-                # Reload gallery with smaller thumbnails for compact mode
-                self._load_file_gallery()
+        # Hide top bar (profile selectors)
+        if self.top_frame is not None:
+            self.top_frame.grid_remove()
 
-            # Hide search and filter buttons
-            if hasattr(self, 'search_entry') and self.search_entry:
-                self.search_entry.grid_remove()
-            if hasattr(self, 'filter_btn') and self.filter_btn:
-                self.filter_btn.grid_remove()
+        # Keep gallery visible if it's already showing, but hide search and filter
+        if self.gallery_visible:
+            # Reload gallery with smaller thumbnails for compact mode
+            self._load_file_gallery()
 
-            # Update gallery button text
-            if hasattr(self, 'gallery_btn'):
-                if hasattr(self, 'gallery_visible') and self.gallery_visible:
-                    self.gallery_btn.configure(text="Hide Gallery")
-                else:
-                    self.gallery_btn.configure(text="Gallery")
+        # Hide search and filter buttons
+        if self.search_entry is not None:
+            self.search_entry.grid_remove()
+        if self.filter_btn is not None:
+            self.filter_btn.grid_remove()
 
-            # Make drag-drop label more prominent in compact mode
-            if hasattr(self, 'drop_label'):
-                self.drop_label.configure(
-                    text="Drop Files\nto Share",
-                    font=("Arial", 14, "bold")
-                )
-        except Exception as e:
-            print(f"⚠️  Failed to switch to compact mode: {e}")
+        # Update gallery button text
+        if self.gallery_btn is not None:
+            if self.gallery_visible:
+                self.gallery_btn.configure(text="Hide Gallery")
+            else:
+                self.gallery_btn.configure(text="Gallery")
+
+        # Make drag-drop label more prominent in compact mode
+        if self.drop_label is not None:
+            self.drop_label.configure(
+                text="Drop Files\nto Share",
+                font=("Arial", 14, "bold")
+            )
 
     def _switch_to_normal_mode(self):
         """Switch back to normal mode - full UI"""
         try:
-            self.is_compact_mode = False
-            print("🖥️  Switching to normal mode")
+            with self._layout_batch():
+                self._apply_normal_layout()
+        except Exception as e:
+            print(f"⚠️  Failed to switch to normal mode: {e}")
 
-            # Restore normal window size (only if window is visible)
-            if self.winfo_viewable():
-                width = self.config_manager.settings.window_width or 1200
-                height = self.config_manager.settings.window_height or 800
-                self.geometry(f"{width}x{height}")
+    def _apply_normal_layout(self):
+        """Restore the top bar, gallery, search and filter for normal mode"""
+        self.is_compact_mode = False
+        print("🖥️  Switching to normal mode")
 
-            # Show top bar
-            if hasattr(self, 'top_frame') and self.top_frame:
-                self.top_frame.grid()
+        # Restore normal window size (only if window is visible)
+        if self.winfo_viewable():
+            width = self.config_manager.settings.window_width or 1200
+            height = self.config_manager.settings.window_height or 800
+            self.geometry(f"{width}x{height}")
 
-            # Reload gallery with normal size thumbnails if it was visible
-            if hasattr(self, 'gallery_visible') and self.gallery_visible:
-                self._load_file_gallery()
-                if hasattr(self, 'gallery_frame') and self.gallery_frame:
-                    self.gallery_frame.grid()
-                    # Show search and filter in normal mode if window is wide enough
-                    window_width = self.winfo_width()
-                    if window_width > 600:
-                        if hasattr(self, 'search_entry'):
-                            self.search_entry.grid(
-                                row=0, column=1, padx=8, sticky="w")
-                        if hasattr(self, 'filter_btn'):
-                            self.filter_btn.grid(
-                                row=0, column=2, padx=(0, 8), sticky="w")
-
-            # Update gallery button text
-            if hasattr(self, 'gallery_btn'):
-                if hasattr(self, 'gallery_visible') and self.gallery_visible:
-                    self.gallery_btn.configure(text="Hide Gallery")
-                else:
-                    self.gallery_btn.configure(text="Show Gallery")
+        # Show top bar
+        if self.top_frame is not None:
+            self.top_frame.grid()
 
-            # Restore normal drag-drop label
-            if hasattr(self, 'drop_label'):
-                self.drop_label.configure(
-                    text="Drag & Drop Files Here",
-                    font=("Arial", 16)
-                )
-        except Exception as e:
-            print(f"⚠️  Failed to switch to normal mode: {e}")
+        # Reload gallery with normal size thumbnails if it was visible
+        if self.gallery_visible:
+            self._load_file_gallery()
+            if self.gallery_frame is not None:
+                self.gallery_frame.grid()
+                # Show search and filter in normal mode if window is wide enough
+                window_width = self.winfo_width()
+                if window_width > 600:
+                    if self.search_entry is not None:
+                        self.search_entry.grid()
+                    if self.filter_btn is not None:
+                        self.filter_btn.grid()
+
+        # Update gallery button text
+        if self.gallery_btn is not None:
+            if self.gallery_visible:
+                self.gallery_btn.configure(text="Hide Gallery")
+            else:
+                self.gallery_btn.configure(text="Show Gallery")
 
-    def _darken_color(self, color):
-        """Darken a color by 10%"""
-        if color.startswith("#"):
-            r = int(color[1:3], 16)
-            g = int(color[3:5], 16)
-            b = int(color[5:7], 16)
-            r = max(0, int(r * 0.9))
-            g = max(0, int(g * 0.9))
-            b = max(0, int(b * 0.9))
-            return f"#{r:02x}{g:02x}{b:02x}"
+        # Restore normal drag-drop label
+        if self.drop_label is not None:
+            self.drop_label.configure(
+                text="Drag & Drop Files Here",
+                font=("Arial", 16)
+            )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _darken_color(color):
+        """Darken a color by 10% (cached per color)"""
+        if color.startswith("#") and len(color) == 7:
+            v = int(color[1:], 16)
+            # 230/256 ~= 0.9, kept in integer fixed-point
+            r = ((v >> 16) * 230) >> 8
+            g = (((v >> 8) & 0xFF) * 230) >> 8
+            b = ((v & 0xFF) * 230) >> 8
+            return f"#{(r << 16) | (g << 8) | b:06x}"
         return color
 
     def _setup_system_tray(self):
         """Setup system tray icon"""
         try:
+            import pystray
+            from pystray import MenuItem as item
+
             # Load icon image - check multiple locations
             icon_name = "blackp2p.ico"
 
-            # Try multiple paths
-            possible_paths = [
-                Path(__file__).parent.parent.parent / "Assets" / icon_name,
-                Path("Assets") / icon_name,
-                Path(sys._MEIPASS) / "Assets" /
-                icon_name if hasattr(sys, '_MEIPASS') else None
-            ]
+            # Try the bundled assets, then the working directory
+            possible_paths = [_asset_path(icon_name), Path("Assets") / icon_name]
 
             icon_image = None
             for icon_path in possible_paths:
@@ -1654,11 +2061,14 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
                 menu
             )
 
-            # Start tray icon in background thread
-            import threading
-            tray_thread = threading.Thread(
-                target=self.tray_icon.run, daemon=True)
-            tray_thread.start()
+            # Let pystray run its own loop alongside Tk's; older releases
+            # and some backends lack run_detached, so fall back to a thread
+            try:
+                self.tray_icon.run_detached()
+            except (AttributeError, NotImplementedError):
+                tray_thread = threading.Thread(
+                    target=self.tray_icon.run, daemon=True)
+                tray_thread.start()
 
             # Override window close button to minimize to tray
             self.protocol("WM_DELETE_WINDOW", self._on_closing)
@@ -1714,7 +2124,7 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         """Handle window close button - minimize to tray instead of exit"""
         if self.tray_icon:
             self._hide_window()
-            if self.toaster:
+            if NOTIFICATIONS_AVAILABLE:
                 self._show_notification(
                     "SyncStream",
                     "App minimized to system tray"
@@ -1724,37 +2134,41 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
 
     def _quit_app(self, icon=None, item=None):
         """Quit the application"""
+        if icon is not None:
+            # Called from the tray's menu thread; stop and quit on Tk's thread
+            self.after(0, self._quit_app)
+            return
         if self.tray_icon:
             self.tray_icon.stop()
-        self.network_manager._running = False
+        network_manager = self.__dict__.get('network_manager')
+        if network_manager:
+            network_manager._running = False
+        self._shutdown_pools()
         self.quit()
 
+    def _shutdown_pools(self):
+        """Stop the background worker pools without blocking the UI"""
+        _shutdown_pool(self._thumb_pool, self._thumb_jobs.values())
+        self._send_pool.shutdown(wait=False)
+        _shutdown_pool(self._notify_pool, self._notify_jobs)
+
     def _handle_drop(self, event):
         """Handle file drop with upload progress"""
         try:
+            # Restore colors and drop label right away, before adding files
             self.is_dragging = False
-
-            # Restore colors
-            if hasattr(self, 'content_frame_original_fg'):
-                self.content_frame.configure(
-                    fg_color=self.content_frame_original_fg)
-
-            # Restore drop label
-            if hasattr(self, 'drop_label'):
-                self.drop_label.configure(
-                    text="Drag & Drop Files Here",
-                    font=("Arial", 16)
-                )
+            self._apply_drag_tint()
 
             # Get files
             files = self.tk.splitlist(event.data)
             added_files = []
 
             for file_path in files:
-                if Path(file_path).is_file() and file_path not in self.shared_files:
-                    self.shared_files.append(file_path)
+                if (file_path not in self._shared_files_set
+                        and Path(file_path).is_file()
+                        and self._add_shared(file_path)):
                     added_files.append(file_path)
-                    print(f"📁 Added to gallery: {Path(file_path).name}")
+                    print(f"📁 Added to gallery: {self._file_meta[file_path]['name']}")
 
             # Refresh gallery
             self._load_file_gallery()
@@ -1811,16 +2225,23 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
             file_list.pack(pady=10, padx=20, fill="both", expand=True)
 
             for fp in files:
-                file_list.insert("end", f"• {Path(fp).name}\n")
+                file_list.insert("end", f"• {self._meta(fp)['name']}\n")
             file_list.configure(state="disabled")
 
             # Buttons frame
             btn_frame = ctk.CTkFrame(overlay, fg_color="transparent")
             btn_frame.pack(pady=10)
 
+            # Auto-dismiss after 10 seconds, unless closed first
+            dismiss_id = self.after(10000, overlay.destroy)
+
+            def close():
+                self.after_cancel(dismiss_id)
+                overlay.destroy()
+
             # Send button
             def send_all():
-                overlay.destroy()
+                close()
                 for fp in files:
                     self._send_file(fp)
 
@@ -1839,7 +2260,7 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
             cancel_btn = ctk.CTkButton(
                 btn_frame,
                 text="Cancel",
-                command=overlay.destroy,
+                command=close,
                 width=120,
                 font=("Arial", 13),
                 fg_color="gray",
@@ -1847,10 +2268,6 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
             )
             cancel_btn.pack(side="left", padx=5)
 
-            # Auto-dismiss after 10 seconds
-            self.after(10000, lambda: overlay.destroy()
-                       if overlay.winfo_exists() else None)
-
         except Exception as e:
             print(f"⚠️  Failed to show upload overlay: {e}")
 
@@ -1860,8 +2277,7 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         files = filedialog.askopenfilenames(title="Select Files to Share")
         if files:
             for file_path in files:
-                if file_path not in self.shared_files:
-                    self.shared_files.append(file_path)
+                self._add_shared(file_path)
             self._load_file_gallery()
             if not self.gallery_visible:
                 self._toggle_gallery()
@@ -1870,7 +2286,7 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         """Toggle file gallery visibility"""
         if self.gallery_visible:
             # Hide gallery
-            self.gallery_frame.grid_forget()
+            self.gallery_frame.grid_remove()
             self.drop_icon.grid()
             self.drop_label.grid()
             self.browse_btn.grid()
@@ -1878,41 +2294,46 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
             self.gallery_visible = False
 
             # Hide search and filter
-            self.search_entry.grid_forget()
-            self.filter_btn.grid_forget()
+            self.search_entry.grid_remove()
+            self.filter_btn.grid_remove()
         else:
             # Hide statistics if showing
             if self.statistics_visible:
-                self.statistics_frame.grid_forget()
+                self.statistics_frame.grid_remove()
                 self.statistics_visible = False
 
             # Hide settings if showing
             if self.settings_visible:
-                self.settings_frame.grid_forget()
+                self.settings_frame.grid_remove()
                 self.settings_visible = False
 
             # Hide profile manager if showing
             if self.profile_manager_visible:
-                self.profile_manager_frame.grid_forget()
+                self.profile_manager_frame.grid_remove()
                 self.profile_manager_visible = False
 
             # Show gallery
-            self.drop_icon.grid_forget()
-            self.drop_label.grid_forget()
-            self.browse_btn.grid_forget()
-            self.gallery_frame.grid(
-                row=3, column=0, sticky="nsew", padx=10, pady=10)
+            self.drop_icon.grid_remove()
+            self.drop_label.grid_remove()
+            self.browse_btn.grid_remove()
+            self.gallery_frame.grid()
             self.gallery_btn.configure(text="Hide Gallery")
             self.gallery_visible = True
 
-            # Reload gallery to ensure correct layout for current mode
-            self._load_file_gallery()
+            # Reload only if files or the layout changed while hidden;
+            # otherwise just fill in rows for the current viewport
+            if (self._gallery_dirty
+                    or self._gallery_layout != (self.is_compact_mode, self.is_connected)):
+                self._load_file_gallery(search_filter=self.search_var.get().lower())
+            else:
+                self._gallery_window = None
+                self._schedule_gallery_refresh()
 
             # Show search and filter only if not in compact mode or if window is wide enough
             window_width = self.winfo_width()
             if not self.is_compact_mode and window_width > 600:
-                self.search_entry.grid(row=0, column=1, padx=8, sticky="w")
-                self.filter_btn.grid(row=0, column=2, padx=(0, 8), sticky="w")
+                self.search_entry.grid()
+                self.filter_btn.grid()
 
     def _cycle_filter(self):
         """Cycle through file filters"""
@@ -1924,332 +2345,474 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         # Update button text
         self.filter_btn.configure(text=f"Filter: {self.current_filter}")
 
-        # Reload gallery with filter
-        self._load_file_gallery()
+        # Reload gallery with filter, once per burst of clicks
+        self._filter_gallery()
 
     def _filter_gallery(self):
-        """Filter gallery based on search text"""
+        """Filter gallery based on search text, debounced while typing"""
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(150, self._do_filter)
+
+    def _do_filter(self):
+        """Apply the current search text to the gallery"""
+        self._filter_after_id = None
         if not self.gallery_visible:
             return
 
         search_text = self.search_var.get().lower()
+        # Edits or clicks that settle back on what's shown (e.g. type then
+        # delete, or cycling all the way round the filters)
+        if (search_text == self._gallery_search
+                and self.current_filter == self._gallery_filter):
+            return
         self._load_file_gallery(search_filter=search_text)
 
     def _get_file_category(self, file_path):
         """Get file category based on extension"""
-        ext = Path(file_path).suffix.lower()
-
-        image_exts = ['.jpg', '.jpeg', '.png',
-                      '.gif', '.bmp', '.svg', '.webp', '.ico']
-        doc_exts = ['.txt', '.pdf', '.doc', '.docx', '.xls',
-                    '.xlsx', '.ppt', '.pptx', '.odt', '.rtf']
-        video_exts = ['.mp4', '.avi', '.mkv',
-                      '.mov', '.wmv', '.flv', '.webm', '.m4v']
-        archive_exts = ['.zip', '.rar', '.7z', '.tar', '.gz', '.bz2', '.xz']
-
-        if ext in image_exts:
-            return "Images"
-        elif ext in doc_exts:
-            return "Documents"
-        elif ext in video_exts:
-            return "Videos"
-        elif ext in archive_exts:
-            return "Archives"
-        else:
-            return "All"
+        return self._meta(file_path)['category']
 
     def _load_file_gallery(self, search_filter=""):
         """Load files into gallery"""
+        # A hidden gallery is rebuilt by _toggle_gallery when it's next shown
+        if not self.gallery_visible:
+            self._gallery_dirty = True
+            return
+        self._gallery_dirty = False
+        self._gallery_search = search_filter
+        self._gallery_filter = self.current_filter
+
         # Debug: Log current mode and expected layout
         mode_str = "COMPACT" if self.is_compact_mode else "NORMAL"
         columns = 2 if self.is_compact_mode else 5
         print(
             f"🔄 Loading gallery in {mode_str} mode with {columns} columns per row")
 
-        # Clear existing items
-        for widget in self.gallery_frame.winfo_children():
-            widget.destroy()
-
-        # Clear file widgets tracking
-        self.file_widgets.clear()
-
-        # Get files from shared_files list
-        files = self.shared_files
-
-        # Apply category filter if not "All"
-        if self.current_filter != "All":
-            files = [f for f in files if self._get_file_category(
-                f) == self.current_filter]
+        # Tiles depend on the card size and whether a send button is shown,
+        # so only throw them all away when one of those changes
+        layout = (self.is_compact_mode, self.is_connected)
+        if layout != self._gallery_layout:
+            for widget in self.gallery_frame.winfo_children():
+                widget.destroy()
+            self.file_widgets.clear()
+            self._tile_paths.clear()
+            self._hidden_tiles.clear()
+            self._gallery_layout = layout
+
+            # Equal-width columns for exactly this mode's column count
+            for i in range(GALLERY_MAX_COLUMNS):
+                used = i < columns
+                self.gallery_frame.grid_columnconfigure(
+                    i, weight=1 if used else 0, uniform="tile" if used else "")
+            self._gallery_empty_label = None
+
+        # Clear any row sizing from a longer list
+        for row in range(self._gallery_row_count):
+            self.gallery_frame.grid_rowconfigure(row, minsize=0)
+        self._gallery_row_count = 0
+        self._gallery_window = None
+
+        # Get files for the current category filter ("All" is every shared file)
+        files = list(self._files_by_category[self.current_filter])
 
         # Apply search filter if provided
         if search_filter:
-            files = [f for f in files if search_filter in Path(f).name.lower()]
+            matches = self._name_index.search(search_filter)
+            files = [f for f in files if f in matches]
 
         if not files:
-            # Use appropriate columnspan based on mode
-            max_columns = 2 if self.is_compact_mode else 5
-            no_files_label = ctk.CTkLabel(
-                self.gallery_frame,
-                text="No files found" if (
-                    search_filter or self.current_filter != "All") else "No files shared yet",
-                font=("Arial", 14),
-                text_color="gray"
-            )
-            no_files_label.grid(
-                row=0, column=0, columnspan=max_columns, pady=20)
-            return
-
-        # Display files in grid
-        for idx, file_path in enumerate(files):
-            # Adjust grid layout and sizes based on compact mode
-            if self.is_compact_mode:
-                columns_per_row = 2
-                row = idx // columns_per_row
-                col = idx % columns_per_row
-                card_width = 230  # 20% bigger than 192
-                card_height = 259  # 20% bigger than 216
-                icon_width = 72  # 20% bigger thumbnails
-                icon_height = 58  # 20% bigger thumbnails (rounded from 57.6)
-                icon_font_size = 46  # 20% bigger
-                name_font_size = 12
-                button_width = 101  # 20% bigger (rounded from 100.8)
-                button_height = 36
-                button_font_size = 14
-                delete_btn_size = 24
-                delete_btn_x_offset = -2
-                delete_btn_y_offset = 14
+            empty_text = "No files found" if (
+                search_filter or self.current_filter != "All") else "No files shared yet"
+            if self._gallery_empty_label is None:
+                self._gallery_empty_label = ctk.CTkLabel(
+                    self.gallery_frame,
+                    text=empty_text,
+                    font=("Arial", 14),
+                    text_color="gray"
+                )
             else:
-                columns_per_row = 5
-                row = idx // columns_per_row
-                col = idx % columns_per_row
-                card_width = 160
-                card_height = 160
-                icon_width = 120
-                icon_height = 90
-                icon_font_size = 40
-                name_font_size = 10
-                button_width = self.btn_width
-                button_height = 34
-                button_font_size = 14
-                delete_btn_size = 28
-                delete_btn_width = 30  # 50% smaller (60 -> 30)
-                delete_btn_x_offset = -2  # Same as compact mode
-                delete_btn_y_offset = 18
-
-            file_name = Path(file_path).name
-
-            # Clean container with subtler styling - remove heavy border and use a minimal look
-            file_frame = ctk.CTkFrame(
-                self.gallery_frame,
-                corner_radius=10,
-                border_width=0,
-                fg_color="transparent"
-            )
-            file_frame.grid(row=row, column=col, padx=8, pady=8, sticky="nsew")
-            # Fix size so all items have equal dimensions
-            try:
-                file_frame.configure(width=card_width, height=card_height)
-                file_frame.grid_propagate(False)
-            except Exception:
-                pass
-
-            # Generate thumbnail or use icon (pass correct size based on mode)
-            thumbnail = self._get_file_thumbnail(
-                file_path, size=(icon_width, icon_height))
+                self._gallery_empty_label.configure(text=empty_text)
+            # Use appropriate columnspan based on mode
+            self._gallery_empty_label.grid(
+                row=0, column=0, columnspan=columns, pady=20)
+        elif self._gallery_empty_label is not None:
+            self._gallery_empty_label.grid_remove()
+
+        # Size every row up front so the scroll region covers the whole list,
+        # but only build tiles for the rows around the viewport
+        self._gallery_files = files
+        self._gallery_row_count = math.ceil(len(files) / columns)
+        for row in range(self._gallery_row_count):
+            self.gallery_frame.grid_rowconfigure(
+                row, minsize=self._gallery_row_height())
+
+        self._realize_gallery_rows()
+
+        # Lay out every grid change above in one pass; a mode switch
+        # flushes once for the whole batch instead
+        if not self._layout_batching:
+            self.gallery_frame.update_idletasks()
+
+    def _gallery_row_height(self):
+        """Height of one gallery row in pixels (card height plus padding)"""
+        if self.is_compact_mode:
+            return 259 + 16  # card_height + pady (8*2)
+        return 160 + 16  # card_height + pady (8*2)
+
+    def _schedule_gallery_refresh(self, event=None):
+        """Coalesce scroll/resize events into a single visible-row refresh"""
+        if self._gallery_refresh_id is None:
+            self._gallery_refresh_id = self.after_idle(
+                self._realize_gallery_rows)
+
+    def _realize_gallery_rows(self):
+        """Show tiles for rows near the viewport and hide the rest"""
+        self._gallery_refresh_id = None
+        files = self._gallery_files
 
-            # Icon container - fixed size so thumbnails and emojis align
-            icon_container = ctk.CTkFrame(
-                file_frame, fg_color="transparent", width=icon_width, height=icon_height)
-            icon_container.pack(pady=(10, 5))
-            try:
-                icon_container.pack_propagate(False)
-            except Exception:
-                pass
+        columns = 2 if self.is_compact_mode else 5
+        row_height = self._gallery_row_height()
+        total_rows = self._gallery_row_count
+
+        canvas = self.gallery_frame._parent_canvas
+        top = canvas.yview()[0]
+        canvas_height = canvas.winfo_height()
+        if canvas_height > 1:
+            visible_rows = math.ceil(canvas_height / row_height)
+        else:
+            # Not mapped yet - assume a typical window height
+            visible_rows = 4
+
+        first_visible = int(top * total_rows)
+        first = max(0, first_visible - GALLERY_BUFFER_ROWS)
+        last = min(total_rows - 1,
+                   first_visible + visible_rows + GALLERY_BUFFER_ROWS)
+        if (first, last) == self._gallery_window:
+            return
+        self._gallery_window = (first, last)
+
+        wanted = {}
+        for row in range(first, last + 1):
+            for col, file_path in enumerate(files[row * columns:(row + 1) * columns]):
+                wanted[file_path] = (row, col)
+
+        # Hide tiles that were filtered out or left the window
+        for file_path, widgets in self.file_widgets.items():
+            if file_path not in wanted and widgets["cell"] is not None:
+                widgets["frame"].grid_remove()
+                widgets["cell"] = None
+                self._hidden_tiles[file_path] = None
+
+        # Destroy the longest-hidden tiles beyond the reuse pool
+        while len(self._hidden_tiles) > GALLERY_TILE_POOL:
+            file_path, _ = self._hidden_tiles.popitem(last=False)
+            frame = self.file_widgets.pop(file_path)["frame"]
+            self._tile_paths.pop(str(frame), None)
+            frame.destroy()
+
+        # Move or re-show existing tiles and build the ones that are new
+        for file_path, cell in wanted.items():
+            widgets = self.file_widgets.get(file_path)
+            if widgets is None:
+                self.file_widgets[file_path] = self._build_file_tile(
+                    file_path, *cell)
+            elif widgets["cell"] != cell:
+                # grid() after grid_remove() keeps the tile's padding/sticky
+                widgets["frame"].grid(row=cell[0], column=cell[1])
+                widgets["cell"] = cell
+                self._hidden_tiles.pop(file_path, None)
+
+    def _build_file_tile(self, file_path, row, col):
+        """Create the gallery tile for a file at the given grid cell"""
+        # Adjust sizes based on compact mode
+        if self.is_compact_mode:
+            card_width = 230  # 20% bigger than 192
+            card_height = 259  # 20% bigger than 216
+            icon_width = 72  # 20% bigger thumbnails
+            icon_height = 58  # 20% bigger thumbnails (rounded from 57.6)
+            icon_font_size = 46  # 20% bigger
+            name_font_size = 12
+            button_width = 101  # 20% bigger (rounded from 100.8)
+            button_height = 36
+            button_font_size = 14
+            delete_btn_size = 24
+            delete_btn_x_offset = -2
+            delete_btn_y_offset = 14
+        else:
+            card_width = 160
+            card_height = 160
+            icon_width = 120
+            icon_height = 90
+            icon_font_size = 40
+            name_font_size = 10
+            button_width = self.btn_width
+            button_height = 34
+            button_font_size = 14
+            delete_btn_size = 28
+            delete_btn_width = 30  # 50% smaller (60 -> 30)
+            delete_btn_x_offset = -2  # Same as compact mode
+            delete_btn_y_offset = 18
+
+        meta = self._file_meta[file_path]
+
+        # Clean container with subtler styling - remove heavy border and use a minimal look
+        # Sized in the constructor so the card is drawn once at its final size
+        file_frame = ctk.CTkFrame(
+            self.gallery_frame,
+            width=card_width,
+            height=card_height,
+            corner_radius=10,
+            border_width=0,
+            fg_color="transparent"
+        )
+        file_frame.grid(row=row, column=col, padx=8, pady=8, sticky="nsew")
 
-            if thumbnail:
-                # Use thumbnail image with transparent background
-                file_icon = ctk.CTkLabel(
-                    icon_container,
-                    image=thumbnail,
-                    text="",
-                    fg_color="transparent"
-                )
-                file_icon.image = thumbnail  # Keep reference
-            else:
-                # Use emoji icon based on file type (scale up to container)
-                icon_emoji = self._get_file_icon(file_path)
-                file_icon = ctk.CTkLabel(
-                    icon_container,
-                    text=icon_emoji,
-                    font=("Arial", icon_font_size),
-                    fg_color="transparent"
-                )
+        # Generate thumbnail or use icon (pass correct size based on mode)
+        thumbnail = self._get_file_thumbnail(
+            file_path, size=(icon_width, icon_height))
 
-            file_icon.pack(expand=True)
+        # Icon container - fixed size so thumbnails and emojis align
+        icon_container = ctk.CTkFrame(
+            file_frame, fg_color="transparent", width=icon_width, height=icon_height)
+        icon_container.pack(pady=(10, 5))
+        try:
+            icon_container.pack_propagate(False)
+        except Exception:
+            pass
 
-            # File name
-            name_label = ctk.CTkLabel(
-                file_frame,
-                text=file_name if len(
-                    file_name) < 20 else file_name[:17] + "...",
-                font=("Arial", name_font_size, "bold")
+        if thumbnail:
+            # Use thumbnail image with transparent background
+            file_icon = ctk.CTkLabel(
+                icon_container,
+                image=thumbnail,
+                text="",
+                fg_color="transparent"
             )
-            name_label.pack(pady=2)
-
-            # Progress bar (initially hidden)
-            progress_bar = ctk.CTkProgressBar(
-                file_frame,
-                width=icon_width,
-                height=10,
-                mode="determinate"
+            file_icon.image = thumbnail  # Keep reference
+        else:
+            # Use emoji icon based on file type (scale up to container)
+            icon_emoji = meta['emoji']
+            file_icon = ctk.CTkLabel(
+                icon_container,
+                text=icon_emoji,
+                font=("Arial", icon_font_size),
+                fg_color="transparent"
             )
-            progress_bar.set(0)
-            # Don't pack it yet - only show during transfer
 
-            # Status label for transfer info
-            status_label = ctk.CTkLabel(
-                file_frame,
-                text="",
-                font=("Arial", 9),
-                text_color="gray"
-            )
-            # Don't pack it yet
+        file_icon.pack(expand=True)
 
-            # Button container - centered
-            btn_container = ctk.CTkFrame(file_frame, fg_color="transparent")
-            btn_container.pack(pady=8, padx=5)
+        # File name - fixed width so the card never resizes to fit a name;
+        # the truncated text is computed once per file in _file_meta
+        name_label = ctk.CTkLabel(
+            file_frame,
+            text=meta['display_name'],
+            width=card_width - 20,
+            font=("Arial", name_font_size, "bold")
+        )
+        name_label.pack(pady=2)
+
+        # Progress bar (initially hidden) - overlaid on the icon area with
+        # place() during a transfer so the card's packed layout never changes.
+        # It and the status label belong to the card, not the small fixed-size
+        # icon container, so the status text isn't clipped to the icon
+        progress_bar = ctk.CTkProgressBar(
+            file_frame,
+            width=icon_width,
+            height=10,
+            mode="determinate"
+        )
+        progress_bar.set(0)
+        # Don't place it yet - only show during transfer
+
+        # Status label for transfer info, updated through its variable
+        status_var = tk.StringVar(file_frame, value="")
+        status_label = ctk.CTkLabel(
+            file_frame,
+            textvariable=status_var,
+            font=("Arial", 9),
+            text_color="gray",
+            wraplength=card_width - 10
+        )
+        # Don't place it yet
+
+        # Button container - centered
+        btn_container = ctk.CTkFrame(file_frame, fg_color="transparent")
+        btn_container.pack(pady=8, padx=5)
+
+        # Open button - lighter green with no icon, bolder text
+        open_btn = ctk.CTkButton(
+            btn_container,
+            text="Open",
+            width=button_width,
+            height=button_height,
+            command=self._tile_command(self._open_file, file_path),
+            font=("Arial", button_font_size, "bold"),
+            fg_color="#3e8a50",  # Lighter green
+            hover_color="#13491F"  # Medium green
+        )
+        open_btn.pack(side="left", padx=3)
 
-            # Open button - lighter green with no icon, bolder text
-            open_btn = ctk.CTkButton(
+        # Send button (only if connected)
+        if self.is_connected:
+            send_btn = ctk.CTkButton(
                 btn_container,
-                text="Open",
+                text="📤",
                 width=button_width,
                 height=button_height,
-                command=lambda fp=file_path: self._open_file(fp),
-                font=("Arial", button_font_size, "bold"),
-                fg_color="#3e8a50",  # Lighter green
-                hover_color="#13491F"  # Medium green
+                command=self._tile_command(self._send_file, file_path),
+                font=self.btn_font,
+                fg_color="#28a745",  # Lighter green
+                hover_color="#218838"  # Medium green
             )
-            open_btn.pack(side="left", padx=3)
-
-            # Send button (only if connected)
-            if self.is_connected:
-                send_btn = ctk.CTkButton(
-                    btn_container,
-                    text="📤",
-                    width=button_width,
-                    height=button_height,
-                    command=lambda fp=file_path: self._send_file(fp),
-                    font=self.btn_font,
-                    fg_color="#28a745",  # Lighter green
-                    hover_color="#218838"  # Medium green
-                )
-                send_btn.pack(side="left", padx=3)
-
-            # Right-click context menu
-            file_frame.bind("<Button-3>", lambda e,
-                            fp=file_path: self._show_file_context_menu(e, fp))
-            file_icon.bind("<Button-3>", lambda e,
-                           fp=file_path: self._show_file_context_menu(e, fp))
-            name_label.bind("<Button-3>", lambda e,
-                            fp=file_path: self._show_file_context_menu(e, fp))
-
-            # Store widget references for progress updates
-            self.file_widgets[file_path] = {
-                "frame": file_frame,
-                "icon": file_icon,
-                "name": name_label,
-                "progress": progress_bar,
-                "status": status_label,
-                "btn_container": btn_container,
-            }
+            send_btn.pack(side="left", padx=3)
+
+        # Right-click context menu via the shared tile bindtag; tag the inner
+        # Tk widgets CTk forwards its own bind() calls to
+        self._tile_paths[str(file_frame)] = file_path
+        for widget in (file_frame._canvas, file_icon._canvas, file_icon._label,
+                       name_label._canvas, name_label._label):
+            widget.bindtags((FILE_TILE_BINDTAG,) + widget.bindtags())
+
+        # Widget references for progress updates
+        return {
+            "frame": file_frame,
+            "icon": file_icon,
+            "name": name_label,
+            "btn_container": btn_container,
+            "cell": (row, col),
+            "icon_size": (icon_width, icon_height),
+            "view": TransferView(progress_bar, status_label, status_var,
+                                 file_icon, area=icon_container),
+        }
+
+    def _tile_command(self, handler, file_path):
+        """Return a button command calling handler(file_path), reused across reloads"""
+        commands = self._tile_commands.setdefault(file_path, {})
+        command = commands.get(handler.__name__)
+        if command is None:
+            command = commands[handler.__name__] = functools.partial(
+                handler, file_path)
+        return command
+
+    def _on_file_tile_right_click(self, event):
+        """Open the context menu for whichever tile was right-clicked"""
+        widget = event.widget
+        while widget is not None:
+            file_path = self._tile_paths.get(str(widget))
+            if file_path is not None:
+                self._show_file_context_menu(event, file_path)
+                return
+            widget = getattr(widget, "master", None)
 
     def _get_file_thumbnail(self, file_path, size=(80, 80)):
-        """Generate thumbnail for image files with aspect ratio preserved"""
+        """Return a loaded thumbnail, or queue it to be generated in the background"""
         try:
-            path = Path(file_path)
-            if path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp', '.ico']:
-                # Use file_manager to generate thumbnail with requested size
-                thumb_path = self.file_manager.generate_thumbnail(
-                    str(file_path), size=size)
-                if thumb_path and Path(thumb_path).exists():
-                    # Load thumbnail as CTkImage
-                    pil_image = Image.open(thumb_path)
-
-                    # Calculate aspect ratio and adjust size to fit within bounds
-                    img_width, img_height = pil_image.size
-                    max_width, max_height = size
-
-                    # Calculate scaling factor to fit within bounds while preserving aspect ratio
-                    width_ratio = max_width / img_width
-                    height_ratio = max_height / img_height
-                    scale_factor = min(width_ratio, height_ratio)
-
-                    # Calculate final size maintaining aspect ratio
-                    final_width = int(img_width * scale_factor)
-                    final_height = int(img_height * scale_factor)
-
-                    ctk_image = ctk.CTkImage(
-                        light_image=pil_image,
-                        dark_image=pil_image,
-                        size=(final_width, final_height)
-                    )
-                    return ctk_image
+            meta = self._meta(file_path)
+            path = meta['path']
+            if meta['suffix'] in _THUMBNAIL_EXTS:
+                # Reuse the image from an earlier reload if the file is unchanged
+                stat = path.stat()
+                cache_key = (file_path, stat.st_mtime_ns, stat.st_size, size)
+                cached = self._thumb_cache.get(cache_key)
+                if cached is not None:
+                    self._thumb_cache.move_to_end(cache_key)
+                    return cached
+                # A tile rebuilt before its first job finished (e.g. scrolled
+                # away and back) picks the image up when that job lands
+                if cache_key in self._thumb_jobs:
+                    return None
+
+                # Decode off the UI thread; the tile shows its emoji until then
+                future = self._thumb_jobs[cache_key] = self._thumb_pool.submit(
+                    self._compute_thumbnail_pil, file_path, size)
+                future.add_done_callback(
+                    lambda f, fp=file_path, key=cache_key: self._schedule_thumbnail(fp, key, f))
         except Exception as e:
             print(f"⚠️  Failed to generate thumbnail: {e}")
         return None
 
+    def _compute_thumbnail_pil(self, file_path, size):
+        """Generate and decode a thumbnail, sized to fit within bounds (worker thread)"""
+        # Use file_manager to generate thumbnail with requested size
+        thumb_path = self.file_manager.generate_thumbnail(
+            str(file_path), size=size)
+        if not thumb_path:
+            return None
+
+        pil_image = Image.open(thumb_path)
+        pil_image.load()
+
+        # Upright source size for the details dialog, known when the thumbnail
+        # was just generated; a disk-cache hit leaves the source unopened and
+        # the dialog reads it when asked
+        dimensions = self.file_manager.image_dimensions.get(str(file_path))
+
+        # Calculate scaling factor to fit within bounds while preserving aspect ratio
+        img_width, img_height = pil_image.size
+        max_width, max_height = size
+        scale_factor = min(max_width / img_width, max_height / img_height)
+
+        # Calculate final size maintaining aspect ratio
+        final_size = (int(img_width * scale_factor),
+                      int(img_height * scale_factor))
+        return pil_image, final_size, dimensions
+
+    def _schedule_thumbnail(self, file_path, cache_key, future):
+        """Hand a finished thumbnail job back to the UI thread"""
+        self._enqueue_ui(functools.partial(
+            self._apply_thumbnail, file_path, cache_key, future))
+
+    def _apply_thumbnail(self, file_path, cache_key, future):
+        """Swap a generated thumbnail into the file's gallery tile"""
+        self._thumb_jobs.pop(cache_key, None)
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"⚠️  Failed to generate thumbnail: {e}")
+            return
+        if result is None:
+            return
+
+        pil_image, final_size, dimensions = result
+        meta = self._file_meta.get(file_path)
+        if meta is not None and dimensions is not None:
+            meta['dimensions'] = dimensions
+
+        ctk_image = ctk.CTkImage(
+            light_image=pil_image,
+            dark_image=pil_image,
+            size=final_size
+        )
+        self._thumb_cache[cache_key] = ctk_image
+        while len(self._thumb_cache) > THUMB_CACHE_LIMIT:
+            self._thumb_cache.popitem(last=False)
+
+        # The tile may have been scrolled away or rebuilt at another size
+        widgets = self.file_widgets.get(file_path)
+        if widgets and widgets["icon_size"] == cache_key[3] and widgets["icon"].winfo_exists():
+            widgets["icon"].configure(image=ctk_image, text="")
+            widgets["view"].forget_icon()
+            widgets["icon"].image = ctk_image  # Keep reference
+
     def _get_file_icon(self, file_path):
         """Get emoji icon based on file type"""
-        path = Path(file_path)
-        ext = path.suffix.lower()
-
-        # Image files
-        if ext in ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp', '.ico']:
-            return "🖼️"
-        # Video files
-        elif ext in ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv']:
-            return "🎬"
-        # Audio files
-        elif ext in ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a']:
-            return "🎵"
-        # Document files
-        elif ext in ['.pdf', '.doc', '.docx', '.txt', '.rtf']:
-            return "📄"
-        # Spreadsheet files
-        elif ext in ['.xls', '.xlsx', '.csv']:
-            return "📊"
-        # Archive files
-        elif ext in ['.zip', '.rar', '.7z', '.tar', '.gz']:
-            return "📦"
-        # Code files
-        elif ext in ['.py', '.js', '.java', '.cpp', '.c', '.html', '.css']:
-            return "💻"
-        else:
-            return "📄"
+        return self._meta(file_path)['emoji']
 
     def _open_file(self, file_path):
         """Open file with default system application"""
+        name = self._meta(file_path)['name']
         try:
-            import os
-            import platform
-
-            path = Path(file_path)
-            if not path.exists():
-                print(f"⚠️  File not found: {file_path}")
-                self._show_notification(
-                    "Error", f"File not found: {path.name}")
-                return
-
-            # Open file based on OS
-            if platform.system() == 'Windows':
-                os.startfile(file_path)
-            elif platform.system() == 'Darwin':  # macOS
-                os.system(f'open "{file_path}"')
-            else:  # Linux
-                os.system(f'xdg-open "{file_path}"')
-
-            print(f"📂 Opened file: {path.name}")
+            # os.startfile reports a missing file itself; the macOS/Linux
+            # openers run detached and never would, so check first there
+            if _SYSTEM != 'Windows' and not os.path.exists(file_path):
+                raise FileNotFoundError(file_path)
+            _open_path(file_path)
+
+            print(f"📂 Opened file: {name}")
+        except FileNotFoundError:
+            print(f"⚠️  File not found: {file_path}")
+            self._show_notification(
+                "Error", f"File not found: {name}")
         except Exception as e:
             print(f"⚠️  Failed to open file: {e}")
             self._show_notification("Error", f"Failed to open file: {str(e)}")
@@ -2257,43 +2820,29 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
     def _show_file_context_menu(self, event, file_path):
         """Show right-click context menu for file"""
         try:
-            import tkinter as tk
-            from tkinter import Menu
-
-            path = Path(file_path)
-
             # Create context menu
-            menu = Menu(self, tearoff=0)
-
-            # Get file info
-            file_info = self.file_manager.get_file_info(file_path)
+            menu = tk.Menu(self, tearoff=0)
 
-            # Add menu items
+            # Add menu items, sharing the tile's cached per-file commands
+            command = self._tile_command
             menu.add_command(
-                label=f"📂 Open", command=lambda: self._open_file(file_path))
+                label=f"📂 Open", command=command(self._open_file, file_path))
             menu.add_command(label=f"📁 Open Location",
-                             command=lambda: self._open_file_location(file_path))
+                             command=command(self._open_file_location, file_path))
             menu.add_separator()
 
             if self.is_connected:
                 menu.add_command(label=f"📤 Send to Peer",
-                                 command=lambda: self._send_file(file_path))
+                                 command=command(self._send_file, file_path))
                 menu.add_separator()
 
-            # File details submenu
-            if file_info:
-                details_label = f"📊 File Info:\n"
-                details_label += f"  Name: {file_info['name']}\n"
-                details_label += f"  Size: {file_info['size_mb']} MB\n"
-                details_label += f"  Type: {file_info['extension']}\n"
-                details_label += f"  Modified: {file_info['modified'][:10]}"
-
-                menu.add_command(label="ℹ️ Show Details", command=lambda: self._show_file_details(
-                    file_path, file_info))
+            # File details are only looked up if the user asks for them
+            menu.add_command(label="ℹ️ Show Details",
+                             command=command(self._show_file_details_lookup, file_path))
 
             menu.add_separator()
             menu.add_command(label="Remove",
-                             command=lambda: self._remove_file(file_path))
+                             command=command(self._remove_file, file_path))
 
             # Display menu at cursor position
             menu.post(event.x_root, event.y_root)
@@ -2304,28 +2853,34 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
     def _open_file_location(self, file_path):
         """Open file location in file explorer"""
         try:
-            import os
-            import platform
-
-            path = Path(file_path)
+            path = self._meta(file_path)['path']
             if not path.exists():
                 print(f"⚠️  File not found: {file_path}")
                 return
 
             parent_dir = path.parent
-
-            # Open folder based on OS
-            if platform.system() == 'Windows':
-                os.startfile(parent_dir)
-            elif platform.system() == 'Darwin':  # macOS
-                os.system(f'open "{parent_dir}"')
-            else:  # Linux
-                os.system(f'xdg-open "{parent_dir}"')
+            _open_path(parent_dir)
 
             print(f"📁 Opened folder: {parent_dir}")
         except Exception as e:
             print(f"⚠️  Failed to open location: {e}")
 
+    def _show_file_details_lookup(self, file_path):
+        """Fetch file info (cached until the file changes) and show the details dialog"""
+        file_info = self.file_manager.get_file_info(file_path)
+        if file_info is None:
+            print(f"⚠️  File not found: {file_path}")
+            return
+
+        # Thumbnails served from the disk cache don't read the source's size
+        meta = self._file_meta.get(file_path)
+        if meta is not None and file_info['is_image'] and 'dimensions' not in meta:
+            dimensions = _read_image_dimensions(file_path)
+            if dimensions is not None:
+                meta['dimensions'] = dimensions
+
+        self._show_file_details(file_path, file_info)
+
     def _show_file_details(self, file_path, file_info):
         """Show detailed file information dialog"""
         try:
@@ -2338,8 +2893,8 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
 
             # Use the standard app icon for dialogs as well
             try:
-                icon_path = self.assets_path / "blackp2p.ico"
-                if icon_path.exists():
+                icon_path = _asset_path("blackp2p.ico")
+                if icon_path:
                     dialog.iconbitmap(str(icon_path))
             except Exception:
                 pass
@@ -2371,28 +2926,33 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
                 ("Is Image:", "Yes" if file_info['is_image'] else "No")
             ]
 
-            for label, value in details:
-                row = ctk.CTkFrame(details_frame, fg_color="transparent")
-                row.pack(pady=5, padx=10, fill="x")
+            # Image dimensions, when they could be read
+            dimensions = self._file_meta.get(file_path, {}).get('dimensions')
+            if dimensions:
+                details.append(
+                    ("Dimensions:", f"{dimensions[0]} × {dimensions[1]} px"))
 
+            # One two-column grid for every row, rather than a frame per row
+            details_frame.grid_columnconfigure(1, weight=1)
+            for row, (label, value) in enumerate(details):
                 label_widget = ctk.CTkLabel(
-                    row,
+                    details_frame,
                     text=label,
                     font=("Arial", 12, "bold"),
                     anchor="w",
                     width=100,
                     text_color=("gray10", "gray90")
                 )
-                label_widget.pack(side="left")
+                label_widget.grid(row=row, column=0, padx=(10, 0), pady=5, sticky="w")
 
                 value_widget = ctk.CTkLabel(
-                    row,
+                    details_frame,
                     text=str(value),
                     font=("Arial", 11),
                     anchor="w",
                     text_color=("gray20", "gray80")
                 )
-                value_widget.pack(side="left", fill="x", expand=True)
+                value_widget.grid(row=row, column=1, padx=(0, 10), pady=5, sticky="ew")
 
             # (Removed explicit Close button - user can close dialog via window chrome)
 
@@ -2403,7 +2963,7 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         """Toggle statistics page visibility"""
         if self.statistics_visible:
             # Hide statistics
-            self.statistics_frame.grid_forget()
+            self.statistics_frame.grid_remove()
             self.drop_icon.grid()
             self.drop_label.grid()
             self.browse_btn.grid()
@@ -2411,27 +2971,27 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         else:
             # Hide gallery if showing
             if self.gallery_visible:
-                self.gallery_frame.grid_forget()
+                self.gallery_frame.grid_remove()
                 self.gallery_visible = False
                 self.gallery_btn.configure(text="Show Gallery")
                 # Hide search and filter
-                self.search_entry.grid_forget()
-                self.filter_btn.grid_forget()
+                self.search_entry.grid_remove()
+                self.filter_btn.grid_remove()
 
             # Hide settings if showing
             if self.settings_visible:
-                self.settings_frame.grid_forget()
+                self.settings_frame.grid_remove()
                 self.settings_visible = False
 
             # Hide profile manager if showing
             if self.profile_manager_visible:
-                self.profile_manager_frame.grid_forget()
+                self.profile_manager_frame.grid_remove()
                 self.profile_manager_visible = False
 
             # Hide drop zone
-            self.drop_icon.grid_forget()
-            self.drop_label.grid_forget()
-            self.browse_btn.grid_forget()
+            self.drop_icon.grid_remove()
+            self.drop_label.grid_remove()
+            self.browse_btn.grid_remove()
 
             # Show statistics
             self.statistics_frame.grid(
@@ -2445,7 +3005,7 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         """Toggle settings page visibility"""
         if self.settings_visible:
             # Hide settings
-            self.settings_frame.grid_forget()
+            self.settings_frame.grid_remove()
             self.drop_icon.grid()
             self.drop_label.grid()
             self.browse_btn.grid()
@@ -2453,27 +3013,27 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         else:
             # Hide gallery if showing
             if self.gallery_visible:
-                self.gallery_frame.grid_forget()
+                self.gallery_frame.grid_remove()
                 self.gallery_visible = False
                 self.gallery_btn.configure(text="Show Gallery")
                 # Hide search and filter
-                self.search_entry.grid_forget()
-                self.filter_btn.grid_forget()
+                self.search_entry.grid_remove()
+                self.filter_btn.grid_remove()
 
             # Hide statistics if showing
             if self.statistics_visible:
-                self.statistics_frame.grid_forget()
+                self.statistics_frame.grid_remove()
                 self.statistics_visible = False
 
             # Hide profile manager if showing
             if self.profile_manager_visible:
-                self.profile_manager_frame.grid_forget()
+                self.profile_manager_frame.grid_remove()
                 self.profile_manager_visible = False
 
             # Hide drop zone
-            self.drop_icon.grid_forget()
-            self.drop_label.grid_forget()
-            self.browse_btn.grid_forget()
+            self.drop_icon.grid_remove()
+            self.drop_label.grid_remove()
+            self.browse_btn.grid_remove()
 
             # Show settings
             self.settings_frame.grid(
@@ -2896,7 +3456,7 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         """Toggle profile manager page visibility"""
         if self.profile_manager_visible:
             # Hide profile manager
-            self.profile_manager_frame.grid_forget()
+            self.profile_manager_frame.grid_remove()
             self.drop_icon.grid()
             self.drop_label.grid()
             self.browse_btn.grid()
@@ -2904,27 +3464,27 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         else:
             # Hide gallery if showing
             if self.gallery_visible:
-                self.gallery_frame.grid_forget()
+                self.gallery_frame.grid_remove()
                 self.gallery_visible = False
                 self.gallery_btn.configure(text="Show Gallery")
                 # Hide search and filter
-                self.search_entry.grid_forget()
-                self.filter_btn.grid_forget()
+                self.search_entry.grid_remove()
+                self.filter_btn.grid_remove()
 
             # Hide statistics if showing
             if self.statistics_visible:
-                self.statistics_frame.grid_forget()
+                self.statistics_frame.grid_remove()
                 self.statistics_visible = False
 
             # Hide settings if showing
             if self.settings_visible:
-                self.settings_frame.grid_forget()
+                self.settings_frame.grid_remove()
                 self.settings_visible = False
 
             # Hide drop zone
-            self.drop_icon.grid_forget()
-            self.drop_label.grid_forget()
-            self.browse_btn.grid_forget()
+            self.drop_icon.grid_remove()
+            self.drop_label.grid_remove()
+            self.browse_btn.grid_remove()
 
             # Show profile manager
             self.profile_manager_frame.grid(
@@ -2946,11 +3506,7 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
             text_color = self.theme_manager.current_theme.text_primary
 
             # Set proper background color based on theme
-            tm_name = getattr(self.theme_manager, 'current_theme_name', None)
-            if tm_name and str(tm_name).lower().startswith('light'):
-                bg_color = '#ffffff'
-            else:
-                bg_color = self.theme_manager.current_theme.bg_primary
+            bg_color = self._get_theme_bg()
 
             # Update profile manager frame background
             self.profile_manager_frame.configure(fg_color=bg_color)
@@ -3061,14 +3617,8 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
                 buttons_container.grid_columnconfigure(1, weight=1)
 
                 # Add button with icon
-                addprofile_icon_path = Path(
-                    __file__).parent.parent.parent / "Assets" / "addprofile.png"
-                if addprofile_icon_path.exists():
-                    addprofile_icon = ctk.CTkImage(
-                        light_image=Image.open(addprofile_icon_path),
-                        dark_image=Image.open(addprofile_icon_path),
-                        size=(20, 20)
-                    )
+                addprofile_icon = self._icon("addprofile.png", (20, 20))
+                if addprofile_icon:
                     add_btn = ctk.CTkButton(
                         buttons_container,
                         text="  Add Profile",
@@ -3197,14 +3747,8 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         ip_label.grid(row=1, column=0, sticky="w")
 
         # Delete button with icon
-        deleteprofile_icon_path = Path(
-            __file__).parent.parent.parent / "Assets" / "deleteprofile.png"
-        if deleteprofile_icon_path.exists():
-            deleteprofile_icon = ctk.CTkImage(
-                light_image=Image.open(deleteprofile_icon_path),
-                dark_image=Image.open(deleteprofile_icon_path),
-                size=(24, 24)
-            )
+        deleteprofile_icon = self._icon("deleteprofile.png")
+        if deleteprofile_icon:
             delete_btn = ctk.CTkButton(
                 info_container,
                 image=deleteprofile_icon,
@@ -3799,20 +4343,53 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
 
     def _remove_file(self, file_path):
         """Remove a file from the gallery"""
-        if file_path in self.shared_files:
+        if file_path in self._shared_files_set:
             self.shared_files.remove(file_path)
-        self._load_file_gallery()
+            self._shared_files_set.discard(file_path)
+            self._unindex_shared_file(file_path)
+            file_manager = self.__dict__.get('file_manager')
+            if file_manager is not None:
+                file_manager.forget_file_info(file_path)
+
+        # Destroy just this file's tile, shown or pooled
+        widgets = self.file_widgets.pop(file_path, None)
+        if widgets is not None:
+            self._tile_paths.pop(str(widgets["frame"]), None)
+            self._hidden_tiles.pop(file_path, None)
+            widgets["frame"].destroy()
+
+        if not self.gallery_visible:
+            self._gallery_dirty = True
+            return
+        if file_path not in self._gallery_files:
+            return
+
+        files = self._gallery_files
+        files.remove(file_path)
+        if not files:
+            # Last match gone; reload to show the empty-gallery message
+            self._load_file_gallery(search_filter=self._gallery_search)
+            return
+
+        # Tiles after the removed one shift back a cell; only the rows near
+        # the viewport are moved, by the usual realize pass
+        columns = 2 if self.is_compact_mode else 5
+        row_count = math.ceil(len(files) / columns)
+        for row in range(row_count, self._gallery_row_count):
+            self.gallery_frame.grid_rowconfigure(row, minsize=0)
+        self._gallery_row_count = row_count
+        self._gallery_window = None
+        self._realize_gallery_rows()
 
     def _send_file(self, file_path):
         """Send a file to the connected peer"""
         if not self.is_connected:
-            print("⚠️  Not connected to any peer")
+            logger.warning("Not connected to any peer")
             return
 
-        if not Path(file_path).exists():
-            print(f"⚠️  File not found: {file_path}")
-            return
+        filename = self._meta(file_path)['name']
 
+        # No exists() pre-check: create_transfer returns None for a missing file
         try:
             # Get peer and sender info
             peer_name = self.peer_profile_var.get()
@@ -3826,7 +4403,7 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
             )
 
             if transfer:
-                print(f"📤 Sending file: {Path(file_path).name}")
+                logger.info("Sending file: %s", filename)
 
                 # Send file in background thread
                 def send_async():
@@ -3836,39 +4413,32 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
                             transfer.transfer_id
                         )
                         if success:
-                            print(
-                                f"✅ File sent successfully: {Path(file_path).name}")
-                            # Add to history with proper metadata
-                            file_info = self.file_manager.get_file_info(
-                                file_path)
-                            if file_info:
-                                self.file_manager.add_to_history(
-                                    file_id=transfer.transfer_id,
-                                    metadata={
-                                        'filename': file_info['name'],
-                                        'file_path': file_path,
-                                        'file_size': file_info['size'],
-                                        'direction': 'sent',
-                                        'peer': peer_name,
-                                        'sender': my_name
-                                    }
-                                )
+                            logger.info("File sent successfully: %s", filename)
+                            # Add to history with the name and size the
+                            # transfer recorded, rather than stat-ing again
+                            self.file_manager.add_to_history(
+                                file_id=transfer.transfer_id,
+                                metadata={
+                                    'filename': transfer.filename,
+                                    'file_path': file_path,
+                                    'file_size': transfer.file_size,
+                                    'direction': 'sent',
+                                    'peer': peer_name,
+                                    'sender': my_name
+                                }
+                            )
                         else:
-                            print(
-                                f"❌ Failed to send file: {Path(file_path).name}")
+                            logger.warning("Failed to send file: %s", filename)
                     else:
-                        print("⚠️  No peer socket available")
+                        logger.warning("No peer socket available")
 
-                threading = __import__('threading')
-                send_thread = threading.Thread(target=send_async, daemon=True)
-                send_thread.start()
+                self._send_pool.submit(send_async)
 
-                print(f"✅ File queued for transfer: {Path(file_path).name}")
+                logger.info("File queued for transfer: %s", filename)
             else:
-                print(
-                    f"❌ Failed to create transfer for: {Path(file_path).name}")
+                logger.warning("Failed to create transfer for: %s", filename)
         except Exception as e:
-            print(f"❌ Failed to send file: {e}")
+            logger.warning("Failed to send file: %s", e)
 
     def _toggle_connection(self):
         """Toggle connection to peer"""
@@ -3997,14 +4567,10 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
     def _update_scrollable_frame_backgrounds(self):
         """Update internal backgrounds of scrollable frames based on current theme"""
         try:
-            tm_name = getattr(self.theme_manager, 'current_theme_name', None)
-            if tm_name and str(tm_name).lower().startswith('light'):
-                bg_color = '#ffffff'
-            else:
-                bg_color = self.theme_manager.current_theme.bg_primary
+            bg_color = self._get_theme_bg()
 
             # Update content frame
-            if hasattr(self, 'content_frame'):
+            if self.content_frame is not None:
                 try:
                     self.content_frame.configure(fg_color=bg_color)
                 except Exception as e:
@@ -4042,17 +4608,46 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
 
     def _toggle_theme(self):
         """Toggle between light and dark theme with smooth transition"""
-        # Fade out effect
-        steps = 10
-        for i in range(steps, 0, -1):
-            alpha = i / steps
-            try:
-                self.attributes('-alpha', alpha)
-            except:
-                pass
-            self.update()
-            self.after(15)
+        if self._theme_fading:
+            return
+
+        # Each fade step redraws every widget; skip it on large galleries
+        # or when animations are turned off
+        if (not self.theme_manager.animations_enabled
+                or len(self.file_widgets) > THEME_FADE_MAX_TILES):
+            self._apply_theme_toggle()
+            return
+
+        # Fade out, switch theme, fade back in - scheduled with after()
+        # so the event loop keeps running between steps
+        self._theme_fading = True
+        self._fade_window(THEME_FADE_STEPS, 1, -1, self._on_theme_faded_out)
+
+    def _on_theme_faded_out(self):
+        """Switch theme while the window is faded out, then fade back in"""
+        try:
+            self._apply_theme_toggle()
+        finally:
+            self._fade_window(1, THEME_FADE_STEPS, 1, self._on_theme_faded_in)
+
+    def _on_theme_faded_in(self):
+        """Mark the theme fade as finished"""
+        self._theme_fading = False
+
+    def _fade_window(self, step, end_step, delta, on_done):
+        """Set window opacity for one fade step and schedule the next"""
+        try:
+            self.attributes('-alpha', step / THEME_FADE_STEPS)
+        except Exception:
+            pass
+        if step == end_step:
+            on_done()
+        else:
+            self.after(15, self._fade_window,
+                       step + delta, end_step, delta, on_done)
 
+    def _apply_theme_toggle(self):
+        """Switch theme and restyle the widgets that don't follow it automatically"""
         # Toggle theme
         self.theme_manager.toggle_theme()
         ctk.set_appearance_mode(self.theme_manager.get_ctk_theme_mode())
@@ -4060,51 +4655,13 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
         # Update scrollable frame backgrounds for new theme
         self._update_scrollable_frame_backgrounds()
 
-        # Keep the app icon static (blackp2p.ico) regardless of theme
-        try:
-            icon_path = self.assets_path / "blackp2p.ico"
-            if icon_path.exists():
-                self.iconbitmap(str(icon_path))
-        except Exception as e:
-            print(f"⚠️  Failed to update window icon: {e}")
-
-        # Update theme button icon
-        try:
-            icon_name = "sun.png" if self.theme_manager.current_theme_name == "dark" else "moon.png"
-            icon_path = Path(__file__).parent.parent.parent / \
-                "Assets" / icon_name
-
-            if icon_path.exists():
-                icon_image = ctk.CTkImage(
-                    light_image=Image.open(icon_path),
-                    dark_image=Image.open(icon_path),
-                    size=(24, 24)
-                )
-                self.theme_btn.configure(image=icon_image)
-            else:
-                theme_icon = "☀️" if self.theme_manager.current_theme_name == "dark" else "🌙"
-                self.theme_btn.configure(text=theme_icon)
-        except Exception as e:
-            print(f"⚠️  Failed to update theme icon: {e}")
+        # The app icon (blackp2p.ico) set at startup is the same for both
+        # themes, and the theme button and upload icons switch variants with
+        # the appearance mode; only the text fallback needs updating by hand
+        if self._theme_icon is None:
             theme_icon = "☀️" if self.theme_manager.current_theme_name == "dark" else "🌙"
             self.theme_btn.configure(text=theme_icon)
 
-        # Update upload icon based on theme
-        try:
-            icon_name = "whiteupload.png" if self.theme_manager.current_theme_name == "dark" else "blackupload.png"
-            icon_path = Path(__file__).parent.parent.parent / \
-                "Assets" / icon_name
-
-            if icon_path.exists():
-                upload_image = ctk.CTkImage(
-                    light_image=Image.open(icon_path),
-                    dark_image=Image.open(icon_path),
-                    size=(64, 64)
-                )
-                self.drop_icon.configure(image=upload_image)
-        except Exception as e:
-            print(f"⚠️  Failed to update upload icon: {e}")
-
         # Update top/bottom bar colors
         try:
             self._update_top_bar_theme()
@@ -4120,13 +4677,13 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
             self.configure(bg=new_bg)
 
             # Update main_frame and content_frame backgrounds
-            if hasattr(self, 'main_frame'):
+            if self.main_frame is not None:
                 self.main_frame.configure(fg_color=new_bg)
-            if hasattr(self, 'content_frame'):
+            if self.content_frame is not None:
                 self.content_frame.configure(fg_color=new_bg)
 
             # Update gallery frame background
-            if hasattr(self, 'gallery_frame'):
+            if self.gallery_frame is not None:
                 self.gallery_frame.configure(fg_color=new_bg)
 
             # Update container (root container frame)
@@ -4134,164 +4691,224 @@ class MainWindow(ctk.CTk if not DRAG_DROP_AVAILABLE else TkinterDnD.Tk):
                 if isinstance(widget, ctk.CTkFrame):
                     widget.configure(fg_color=new_bg)
         except Exception as e:
-            # Fade in effect
             print(f"⚠️  Failed to update background on theme toggle: {e}")
-        for i in range(1, steps + 1):
-            alpha = i / steps
-            try:
-                self.attributes('-alpha', alpha)
-            except:
-                pass
-            self.update()
-            self.after(15)
 
         # Store new original fg color
         self.content_frame_original_fg = self.content_frame.cget("fg_color")
 
     def _show_notification(self, title, message, duration=5):
         """Show a Windows toast notification"""
-        if self.toaster:
+        if NOTIFICATIONS_AVAILABLE:
             try:
-                import threading
-                # Run in background thread to avoid blocking UI
-
-                def show():
-                    self.toaster.show_toast(
-                        title,
-                        message,
-                        duration=duration,
-                        icon_path=None,
-                        threaded=True
-                    )
-                threading.Thread(target=show, daemon=True).start()
+                # Run on the single notification worker so toasts are queued
+                # and shown one after another without blocking the UI
+                self._notify_jobs = [f for f in self._notify_jobs if not f.done()]
+                self._notify_jobs.append(self._notify_pool.submit(
+                    self._show_toast, title, message, duration))
             except Exception as e:
                 print(f"⚠️  Failed to show notification: {e}")
 
+    def _show_toast(self, title, message, duration):
+        """Show one toast and wait for it to close (notification worker)"""
+        toaster = self.toaster
+        if toaster:
+            # threaded=True would return at once and drop toasts that arrive
+            # while another is still showing
+            toaster.show_toast(
+                title,
+                message,
+                duration=duration,
+                icon_path=None,
+                threaded=False
+            )
+
     # Transfer protocol callbacks
+
+    def _enqueue_ui(self, callback):
+        """Queue a UI update from any thread for the next drain tick"""
+        self._ui_q.put(callback)
+
+    def _drain_ui_queue(self):
+        """Run queued UI updates, at most a frame's worth per tick"""
+        ran = False
+        for _ in range(UI_DRAIN_BATCH):
+            try:
+                callback = self._ui_q.get_nowait()
+            except queue.Empty:
+                break
+            ran = True
+            try:
+                callback()
+            except Exception as e:
+                print(f"⚠️  UI update failed: {e}")
+        if ran:
+            # One layout/redraw pass for the whole batch rather than one per update
+            self.update_idletasks()
+        self.after(UI_DRAIN_INTERVAL_MS, self._drain_ui_queue)
+
+    def _hide_progress(self, file_path):
+        """Hide a finished transfer's progress bar and status on its tile"""
+        self._pending_afters.pop(file_path, None)
+        widgets = self.file_widgets.get(file_path)
+        if widgets:
+            widgets["view"].hide_progress()
+
+    def _reset_display(self, file_path):
+        """Clear a failed transfer's status from its tile"""
+        self._pending_afters.pop(file_path, None)
+        widgets = self.file_widgets.get(file_path)
+        if widgets:
+            widgets["view"].reset()
+
     def _on_transfer_start(self, transfer):
         """Handle transfer start"""
+        # Queued closures capture plain values, not the Transfer object
+        transfer_id = transfer.transfer_id
+        file_path = transfer.file_path
+        filename = transfer.filename
+        file_size = transfer.file_size
+
         def update_ui():
-            print(
-                f"📤 Transfer started: {transfer.filename} ({transfer.file_size} bytes)")
+            logger.info("Transfer started: %s (%d bytes)", filename, file_size)
             # Store transfer for progress tracking
-            self.active_transfers[transfer.transfer_id] = transfer
+            self.active_transfers[transfer_id] = TransferSlot(file_path, filename)
 
             # Show progress bar in gallery item
-            if transfer.file_path in self.file_widgets:
-                widgets = self.file_widgets[transfer.file_path]
-                # Show and reset progress bar
-                widgets["progress"].set(0)
-                widgets["progress"].pack(pady=2)
-                # Show status label
-                widgets["status"].configure(text="Uploading... 0%")
-                widgets["status"].pack(pady=2)
-                # Change icon to uploading
-                widgets["icon"].configure(text="📤")
+            widgets = self.file_widgets.get(file_path)
+            if widgets:
+                widgets["view"].start()
 
             # Show notification
             self._show_notification(
                 "File Transfer Started",
-                f"Sending {transfer.filename}..."
+                _START_TMPL % filename
             )
-        self.after(0, update_ui)
+        self._enqueue_ui(update_ui)
 
     def _on_transfer_progress(self, transfer):
         """Handle transfer progress"""
-        def update_ui():
-            progress = transfer.progress_percent
+        # Fired for every chunk; keep only the latest value per transfer and
+        # apply them all on one 50 ms tick
+        with self._ui_lock:
+            self._pending_progress[transfer.transfer_id] = (
+                transfer, transfer.progress_percent)
+            if self._progress_flush_scheduled:
+                return
+            self._progress_flush_scheduled = True
+        # Arm the timer from the UI thread; Tk calls stay off the network thread
+        self._enqueue_ui(self._schedule_progress_flush)
+
+    def _schedule_progress_flush(self):
+        """Start the 50 ms timer that applies coalesced progress (UI thread)"""
+        self.after(50, self._flush_progress)
+
+    def _flush_progress(self):
+        """Apply the latest coalesced progress update of each transfer"""
+        with self._ui_lock:
+            pending = list(self._pending_progress.values())
+            self._pending_progress.clear()
+            self._progress_flush_scheduled = False
+
+        file_widgets = self.file_widgets
+        for transfer, progress in pending:
             speed = transfer.transfer_speed / 1024  # KB/s
-            eta = transfer.eta_seconds
-
-            # Update progress bar in gallery item
-            if transfer.file_path in self.file_widgets:
-                widgets = self.file_widgets[transfer.file_path]
-                widgets["progress"].set(progress / 100)
-                widgets["status"].configure(
-                    text=f"Uploading... {progress:.0f}% ({speed:.1f} KB/s)"
-                )
 
-            print(
-                f"📊 Progress: {transfer.filename} - {progress:.1f}% ({speed:.1f} KB/s, ETA: {eta:.0f}s)")
-        self.after(0, update_ui)
+            # Update progress bar in gallery item, unless it's not on screen
+            widgets = file_widgets.get(transfer.file_path)
+            if widgets and widgets["frame"].winfo_viewable():
+                widgets["view"].update(
+                    progress / 100,
+                    f"Uploading... {progress:.0f}% ({speed:.1f} KB/s)")
+
+            logger.debug("Progress: %s - %.1f%% (%.1f KB/s, ETA: %.0fs)",
+                         transfer.filename, progress, speed, transfer.eta_seconds)
+
+    def _drop_progress(self, transfer_id):
+        """Discard a transfer's unapplied progress once its final state is known"""
+        with self._ui_lock:
+            self._pending_progress.pop(transfer_id, None)
 
     def _on_transfer_complete(self, transfer):
         """Handle transfer complete"""
+        transfer_id = transfer.transfer_id
+        file_path = transfer.file_path
+        filename = transfer.filename
+
         def update_ui():
-            print(f"✅ Transfer complete: {transfer.filename}")
+            # The final state supersedes any progress still waiting for a tick
+            self._drop_progress(transfer_id)
+            logger.info("Transfer complete: %s", filename)
             # Remove from active transfers
-            if transfer.transfer_id in self.active_transfers:
-                del self.active_transfers[transfer.transfer_id]
+            self.active_transfers.pop(transfer_id, None)
 
             # Update gallery item to show completion
-            if transfer.file_path in self.file_widgets:
-                widgets = self.file_widgets[transfer.file_path]
-                widgets["progress"].set(1.0)
-                widgets["status"].configure(text="✅ Sent!", text_color="green")
-                widgets["icon"].configure(text="✅")
+            widgets = self.file_widgets.get(file_path)
+            if widgets:
+                widgets["view"].mark_done()
 
                 # Hide progress bar after 3 seconds
-                def hide_progress():
-                    if transfer.file_path in self.file_widgets:
-                        widgets["progress"].pack_forget()
-                        widgets["status"].pack_forget()
-                        widgets["icon"].configure(text="📄")
-                self.after(3000, hide_progress)
+                self._pending_afters[file_path].append(
+                    self.after(3000, self._hide_progress, file_path))
 
             # Show notification
             self._show_notification(
                 "File Transfer Complete",
-                f"Successfully sent {transfer.filename}"
+                _OK_TMPL % filename
             )
-        self.after(0, update_ui)
+        self._enqueue_ui(update_ui)
 
     def _on_transfer_error(self, transfer, error_msg):
         """Handle transfer error"""
+        transfer_id = transfer.transfer_id
+        file_path = transfer.file_path
+        filename = transfer.filename
+
         def update_ui():
-            print(f"❌ Transfer error: {transfer.filename} - {error_msg}")
+            # The final state supersedes any progress still waiting for a tick
+            self._drop_progress(transfer_id)
+            logger.warning("Transfer error: %s - %s", filename, error_msg)
             # Remove from active transfers
-            if transfer.transfer_id in self.active_transfers:
-                del self.active_transfers[transfer.transfer_id]
+            self.active_transfers.pop(transfer_id, None)
 
             # Update gallery item to show error
-            if transfer.file_path in self.file_widgets:
-                widgets = self.file_widgets[transfer.file_path]
-                widgets["progress"].pack_forget()
-                widgets["status"].configure(text="❌ Failed", text_color="red")
-                widgets["icon"].configure(text="❌")
+            widgets = self.file_widgets.get(file_path)
+            if widgets:
+                widgets["view"].mark_failed()
 
                 # Reset after 3 seconds
-                def reset_display():
-                    if transfer.file_path in self.file_widgets:
-                        widgets["status"].pack_forget()
-                        widgets["icon"].configure(text="📄")
-                self.after(3000, reset_display)
+                self._pending_afters[file_path].append(
+                    self.after(3000, self._reset_display, file_path))
 
             # Show notification
             self._show_notification(
                 "File Transfer Failed",
-                f"Failed to send {transfer.filename}: {error_msg}"
+                _FAIL_TMPL % (filename, error_msg)
             )
-        self.after(0, update_ui)
+        self._enqueue_ui(update_ui)
+
+
+@functools.lru_cache(maxsize=None)
+def _app_data_dir():
+    """Application data directory, created if missing (resolved once per process)"""
+    app_data_dir = Path(os.getenv('APPDATA')) / 'SyncStream'
+    app_data_dir.mkdir(parents=True, exist_ok=True)
+    return app_data_dir
 
 
 def main():
     """Main entry point"""
-    import os
-    from pathlib import Path
     from ui.theme_manager import ThemeManager
-    from core.network_manager import NetworkManager
-    from core.file_manager import FileManager
 
-    # Initialize managers
-    app_data_dir = Path(os.getenv('APPDATA')) / 'SyncStream'
-    app_data_dir.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
 
+    # Only the theme is needed to draw the first frame; the network and
+    # file managers are created by the window on first use
     theme_manager = ThemeManager()
-    network_manager = NetworkManager()
-    file_manager = FileManager(app_data_dir)
 
     # Create and run app
-    app = MainWindow(theme_manager, network_manager, file_manager)
+    app = MainWindow(theme_manager)
+    # Warm the remaining managers once the window has painted
+    app.after_idle(lambda: (app.network_manager, app.file_manager))
     app.mainloop()
 
 
@@ -107,15 +107,18 @@ class ThemeManager:
         hover_overlay="rgba(255, 255, 255, 0.05)"
     )
 
-    def __init__(self, current_theme: str = "dark"):
+    def __init__(self, current_theme: str = "dark", animations_enabled: bool = True):
         """
         Initialize theme manager
 
         Args:
             current_theme: "light" or "dark"
+            animations_enabled: Whether theme switches fade the window
         """
         self.current_theme_name = current_theme
+        self.animations_enabled = animations_enabled
         self._callbacks = []
+        self._frame_colors = {}  # {theme name: frame colors}
 
     @property
     def current_theme(self) -> ThemeColors:
@@ -170,12 +173,15 @@ class ThemeManager:
         }
 
     def get_frame_colors(self) -> Dict:
-        """Get frame color configuration"""
-        theme = self.current_theme
-        return {
-            "fg_color": theme.bg_secondary,
-            "border_color": theme.border
-        }
+        """Get frame color configuration (built once per theme; treat as read-only)"""
+        colors = self._frame_colors.get(self.current_theme_name)
+        if colors is None:
+            theme = self.current_theme
+            colors = self._frame_colors[self.current_theme_name] = {
+                "fg_color": theme.bg_secondary,
+                "border_color": theme.border
+            }
+        return colors
 
     def get_entry_colors(self) -> Dict:
         """Get entry/input color configuration"""
@@ -0,0 +1,88 @@
+"""
+Transfer View for SyncStream
+
+Per-tile handles for showing transfer state on a gallery tile.
+"""
+
+
+class TransferView:
+    """Drives one gallery tile's progress bar, status label and icon through a transfer"""
+
+    __slots__ = ("progress", "status", "status_var", "icon", "area",
+                 "_status_text", "_status_color", "_icon_text")
+
+    def __init__(self, progress, status, status_var, icon, area=None):
+        """
+        Initialize the view
+
+        Args:
+            progress: Progress bar overlaid on the tile's icon area
+            status: Status label overlaid above the progress bar
+            status_var: StringVar bound as the status label's textvariable
+            icon: Icon label swapped for a state emoji during transfers
+            area: Widget the overlay is placed over, if not the bar's parent
+        """
+        self.progress = progress
+        self.status = status
+        self.status_var = status_var
+        self.icon = icon
+        self.area = area
+        # Last values pushed to the widgets, to skip no-op updates
+        self._status_text = None
+        self._status_color = None
+        self._icon_text = None
+
+    def _set_status(self, text, text_color=None):
+        """Show status text, recoloring only when a new color is given"""
+        if text != self._status_text:
+            self.status_var.set(text)
+            self._status_text = text
+        if text_color is not None and text_color != self._status_color:
+            self.status.configure(text_color=text_color)
+            self._status_color = text_color
+
+    def _set_icon(self, text):
+        """Show an emoji in place of the icon, skipping the call if unchanged"""
+        if text != self._icon_text:
+            self.icon.configure(text=text)
+            self._icon_text = text
+
+    def forget_icon(self):
+        """Note that the icon was reconfigured elsewhere (e.g. given a thumbnail)"""
+        self._icon_text = None
+
+    def start(self):
+        """Show an empty progress bar and uploading status"""
+        self.progress.set(0)
+        place = {"in_": self.area} if self.area is not None else {}
+        self.progress.place(relx=0.5, rely=1.0, anchor="s", **place)
+        self._set_status("Uploading... 0%")
+        self.status.place(relx=0.5, rely=1.0, y=-12, anchor="s", **place)
+        self._set_icon("📤")
+
+    def update(self, fraction, text):
+        """Advance the progress bar and status text"""
+        self.progress.set(fraction)
+        self._set_status(text)
+
+    def mark_done(self):
+        """Show a completed transfer"""
+        self.progress.set(1.0)
+        self._set_status("✅ Sent!", text_color="green")
+        self._set_icon("✅")
+
+    def mark_failed(self):
+        """Show a failed transfer"""
+        self.progress.place_forget()
+        self._set_status("❌ Failed", text_color="red")
+        self._set_icon("❌")
+
+    def hide_progress(self):
+        """Hide the progress bar and status once a transfer has finished"""
+        self.progress.place_forget()
+        self.reset()
+
+    def reset(self):
+        """Clear the status and restore the idle icon"""
+        self.status.place_forget()
+        self._set_icon("📄")
@@ -0,0 +1,80 @@
+"""
+Name Index for SyncStream
+
+Substring search over file names without scanning every name per query.
+"""
+
+from bisect import bisect_left
+from typing import Dict, List, Set, Tuple
+
+
+class NameIndex:
+    """Case-insensitive substring index over names, backed by a sorted suffix list"""
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self._names: Dict[str, str] = {}
+        self._suffixes: List[Tuple[str, str]] = []
+        self._sorted = True
+
+    def add(self, key: str, name: str) -> None:
+        """
+        Index a name under a key
+
+        Args:
+            key: Identifier returned by searches (e.g. the file path)
+            name: Name to make searchable
+        """
+        if key in self._names:
+            self.remove(key)
+
+        name = name.lower()
+        self._names[key] = name
+        # Every substring of the name is a prefix of one of its suffixes
+        self._suffixes.extend((name[i:], key) for i in range(len(name)))
+        # Sort lazily so bulk loads cost one sort rather than one insort per suffix
+        self._sorted = False
+
+    def remove(self, key: str) -> None:
+        """
+        Drop a key from the index
+
+        Args:
+            key: Identifier previously passed to add()
+        """
+        if self._names.pop(key, None) is not None:
+            self._suffixes = [entry for entry in self._suffixes
+                              if entry[1] != key]
+
+    def search(self, query: str) -> Set[str]:
+        """
+        Find keys whose name contains the query
+
+        Args:
+            query: Text to look for (case-insensitive)
+
+        Returns:
+            Set of matching keys
+        """
+        query = query.lower()
+        if not query:
+            return set(self._names)
+
+        if not self._sorted:
+            self._suffixes.sort()
+            self._sorted = True
+
+        # Suffixes starting with the query form one contiguous sorted run
+        matches = set()
+        suffixes = self._suffixes
+        i = bisect_left(suffixes, (query,))
+        while i < len(suffixes) and suffixes[i][0].startswith(query):
+            matches.add(suffixes[i][1])
+            i += 1
+        return matches
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._names
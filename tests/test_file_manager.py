@@ -58,6 +58,27 @@ class TestFileManager(unittest.TestCase):
         self.assertTrue(info['is_image'])
         self.assertGreater(info['size'], 0)
 
+    def test_file_info_cached_until_modified(self):
+        """Test that file info is reused until the file changes"""
+        info = self.file_manager.get_file_info(str(self.test_text))
+        self.assertEqual(self.file_manager.get_file_info(str(self.test_text)), info)
+
+        with open(self.test_text, 'w') as f:
+            f.write("Longer test content")
+        stat = os.stat(self.test_text)
+        os.utime(self.test_text, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        updated = self.file_manager.get_file_info(str(self.test_text))
+        self.assertEqual(updated['size'], len("Longer test content"))
+
+    def test_file_info_copy_not_shared(self):
+        """Test that callers can't alter the cached file info"""
+        info = self.file_manager.get_file_info(str(self.test_text))
+        info['name'] = "changed"
+
+        info = self.file_manager.get_file_info(str(self.test_text))
+        self.assertEqual(info['name'], "test_doc.txt")
+
     def test_generate_thumbnail(self):
         """Test thumbnail generation"""
         thumb_path = self.file_manager.generate_thumbnail(
@@ -88,6 +109,91 @@ class TestFileManager(unittest.TestCase):
         # Should return same path (cached)
         self.assertEqual(thumb_path1, thumb_path2)
 
+    def test_thumbnail_regenerated_when_source_changes(self):
+        """Test that editing the source image invalidates its thumbnail"""
+        thumb_path1 = self.file_manager.generate_thumbnail(
+            str(self.test_image), size=(128, 128))
+
+        # Rewrite the image with different content and a newer mtime
+        Image.new('RGB', (400, 300), color='red').save(self.test_image)
+        stat = os.stat(self.test_image)
+        os.utime(self.test_image, ns=(stat.st_atime_ns,
+                                      stat.st_mtime_ns + 1_000_000_000))
+
+        thumb_path2 = self.file_manager.generate_thumbnail(
+            str(self.test_image), size=(128, 128))
+
+        self.assertNotEqual(thumb_path1, thumb_path2)
+        self.assertTrue(Path(thumb_path2).exists())
+
+    def test_thumbnail_cached_per_size(self):
+        """Test that different thumbnail sizes get separate cache entries"""
+        small = self.file_manager.generate_thumbnail(
+            str(self.test_image), size=(64, 64))
+        large = self.file_manager.generate_thumbnail(
+            str(self.test_image), size=(128, 128))
+
+        self.assertNotEqual(small, large)
+        self.assertLessEqual(Image.open(small).width, 64)
+
+    def test_prune_thumbnails_keeps_recently_used(self):
+        """Test that pruning deletes the least recently used thumbnails"""
+        thumbs = []
+        for i in range(3):
+            image = Path(self.test_dir) / f"prune_{i}.png"
+            Image.new('RGB', (64, 64), color='red').save(image)
+            thumbs.append(self.file_manager.generate_thumbnail(str(image)))
+            os.utime(thumbs[-1], ns=(i * 10**9, i * 10**9))
+
+        # A cache hit on the oldest thumbnail makes it the most recent
+        self.file_manager.generate_thumbnail(str(Path(self.test_dir) / "prune_0.png"))
+
+        removed = self.file_manager.prune_thumbnails(max_files=2)
+
+        self.assertEqual(removed, 1)
+        self.assertTrue(thumbs[0].exists())
+        self.assertFalse(thumbs[1].exists())
+        self.assertTrue(thumbs[2].exists())
+
+    def test_image_dimensions_keyed_by_caller_path(self):
+        """Test that dimensions are stored under the exact path string passed in"""
+        # Path() would normalise this spelling, as it rewrites slashes on Windows
+        raw_path = f"{self.test_dir}/./test_image.png"
+        self.file_manager.generate_thumbnail(raw_path)
+
+        self.assertEqual(self.file_manager.image_dimensions[raw_path], (800, 600))
+
+    def test_generate_jpeg_thumbnail(self):
+        """Test thumbnail generation for a large JPEG decoded in draft mode"""
+        jpeg_path = Path(self.test_dir) / "large_photo.jpg"
+        Image.new('RGB', (2400, 1600), color='green').save(jpeg_path)
+
+        thumb_path = self.file_manager.generate_thumbnail(
+            str(jpeg_path), size=(120, 90))
+
+        self.assertIsNotNone(thumb_path)
+        thumb_img = Image.open(thumb_path)
+        self.assertLessEqual(thumb_img.width, 120)
+        self.assertLessEqual(thumb_img.height, 90)
+        # Aspect ratio is preserved
+        self.assertEqual(thumb_img.size, (120, 80))
+
+    def test_thumbnail_applies_exif_orientation(self):
+        """Test that rotated photos get upright thumbnails and dimensions"""
+        jpeg_path = Path(self.test_dir) / "rotated.jpg"
+        img = Image.new('RGB', (800, 600), color='yellow')
+        exif = img.getexif()
+        exif[0x0112] = 6  # Rotate 90 CW to display
+        img.save(jpeg_path, exif=exif)
+
+        thumb_path = self.file_manager.generate_thumbnail(
+            str(jpeg_path), size=(128, 128))
+
+        thumb_img = Image.open(thumb_path)
+        self.assertGreater(thumb_img.height, thumb_img.width)
+        self.assertEqual(
+            self.file_manager.image_dimensions[str(jpeg_path)], (600, 800))
+
     def test_add_to_history(self):
         """Test adding files to transfer history"""
         file_id = "test123"
@@ -155,6 +261,13 @@ class TestFileManager(unittest.TestCase):
             if info:  # Only check if file exists
                 self.assertTrue(info['is_image'])
 
+    def test_file_icon_emoji(self):
+        """Test emoji lookup by extension"""
+        self.assertEqual(self.file_manager.get_file_icon_emoji('.PNG'), "🖼️")
+        self.assertEqual(self.file_manager.get_file_icon_emoji('.mkv'), "🎥")
+        self.assertEqual(self.file_manager.get_file_icon_emoji('.h'), "💻")
+        self.assertEqual(self.file_manager.get_file_icon_emoji('.xyz'), "📁")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,72 @@
+"""
+Unit tests for NameIndex
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.name_index import NameIndex
+
+
+class TestNameIndex(unittest.TestCase):
+    """Test cases for NameIndex"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.index = NameIndex()
+        self.index.add("/a/holiday_photo.jpg", "Holiday_Photo.jpg")
+        self.index.add("/b/graph.png", "graph.png")
+        self.index.add("/c/notes.txt", "notes.txt")
+
+    def test_prefix_search(self):
+        """Test matching at the start of a name"""
+        self.assertEqual(self.index.search("holi"), {"/a/holiday_photo.jpg"})
+
+    def test_substring_search(self):
+        """Test matching anywhere inside a name, like str.__contains__"""
+        self.assertEqual(self.index.search("ph"),
+                         {"/a/holiday_photo.jpg", "/b/graph.png"})
+        self.assertEqual(self.index.search("ote"), {"/c/notes.txt"})
+
+    def test_case_insensitive(self):
+        """Test that queries and names are compared lowercased"""
+        self.assertEqual(self.index.search("PHOTO"), {"/a/holiday_photo.jpg"})
+
+    def test_no_match(self):
+        """Test a query that matches nothing"""
+        self.assertEqual(self.index.search("xyz"), set())
+
+    def test_empty_query_returns_all(self):
+        """Test that an empty query matches every key"""
+        self.assertEqual(len(self.index.search("")), 3)
+
+    def test_remove(self):
+        """Test that removed keys no longer match"""
+        self.index.remove("/b/graph.png")
+
+        self.assertEqual(self.index.search("ph"), {"/a/holiday_photo.jpg"})
+        self.assertNotIn("/b/graph.png", self.index)
+        self.assertEqual(len(self.index), 2)
+
+    def test_add_after_search(self):
+        """Test that names added after a search are found"""
+        self.index.search("png")
+        self.index.add("/d/photo.png", "photo.png")
+
+        self.assertEqual(self.index.search("png"),
+                         {"/b/graph.png", "/d/photo.png"})
+
+    def test_readd_replaces_name(self):
+        """Test that adding an existing key replaces its old name"""
+        self.index.add("/c/notes.txt", "todo.txt")
+
+        self.assertEqual(self.index.search("notes"), set())
+        self.assertEqual(self.index.search("todo"), {"/c/notes.txt"})
+
+
+if __name__ == '__main__':
+    unittest.main()
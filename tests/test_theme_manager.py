@@ -92,6 +92,12 @@ class TestThemeManager(unittest.TestCase):
         """Test ThemeManager initializes with light theme when specified"""
         tm = ThemeManager(current_theme="light")
         self.assertEqual(tm.current_theme_name, "light")
+
+    def test_animations_enabled_by_default(self):
+        """Test theme fades are on unless disabled"""
+        self.assertTrue(self.tm.animations_enabled)
+        tm = ThemeManager(animations_enabled=False)
+        self.assertFalse(tm.animations_enabled)
     
     def test_dark_theme_colors(self):
         """Test dark theme has correct colors"""
@@ -161,6 +167,17 @@ class TestThemeManager(unittest.TestCase):
         self.assertIn('fg_color', colors)
         self.assertIn('border_color', colors)
     
+    def test_frame_colors_cached_per_theme(self):
+        """Test that frame colors are reused until the theme changes"""
+        self.tm.set_theme("dark")
+        dark = self.tm.get_frame_colors()
+        self.assertIs(self.tm.get_frame_colors(), dark)
+
+        self.tm.toggle_theme()
+        light = self.tm.get_frame_colors()
+        self.assertIsNot(light, dark)
+        self.assertEqual(light['fg_color'], self.tm.current_theme.bg_secondary)
+    
     def test_get_button_colors(self):
         """Test getting button colors"""
         colors = self.tm.get_button_colors()
@@ -166,6 +166,24 @@ class TestTransferProtocol(unittest.TestCase):
 
         self.assertIn(transfer.transfer_id, self.callback_data['started'])
 
+    def test_register_callbacks_bulk(self):
+        """Test registering several callbacks in one call"""
+        self.protocol.register_callbacks({
+            'on_transfer_start': self.callback_start,
+            'on_transfer_complete': self.callback_complete,
+            'on_unknown_event': self.callback_start,
+        })
+
+        self.assertEqual(
+            self.protocol.callbacks['on_transfer_start'], [self.callback_start])
+        self.assertEqual(
+            self.protocol.callbacks['on_transfer_complete'], [self.callback_complete])
+        self.assertNotIn('on_unknown_event', self.protocol.callbacks)
+
+        transfer = self.protocol.create_transfer(str(self.test_file), "A", "B")
+        self.protocol._trigger_callback('on_transfer_start', transfer)
+        self.assertIn(transfer.transfer_id, self.callback_data['started'])
+
     def test_transfer_status_transitions(self):
         """Test transfer status transitions"""
         transfer = self.protocol.create_transfer(str(self.test_file), "A", "B")
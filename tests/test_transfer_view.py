@@ -0,0 +1,102 @@
+"""
+Unit tests for TransferView
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ui.transfer_view import TransferView
+
+
+class FakeWidget:
+    """Records the calls a TransferView makes on a widget"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+
+class TestTransferView(unittest.TestCase):
+    """Test cases for TransferView"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.progress = FakeWidget()
+        self.status = FakeWidget()
+        self.status_var = FakeWidget()
+        self.icon = FakeWidget()
+        self.view = TransferView(self.progress, self.status,
+                                 self.status_var, self.icon)
+
+    def configures(self, widget):
+        return [kwargs for name, _, kwargs in widget.calls if name == "configure"]
+
+    def status_texts(self):
+        return [args[0] for name, args, _ in self.status_var.calls if name == "set"]
+
+    def test_start_shows_progress(self):
+        """Test that starting places the overlay and sets the uploading state"""
+        self.view.start()
+
+        self.assertIn(("set", (0,), {}), self.progress.calls)
+        self.assertIn("place", [name for name, _, _ in self.progress.calls])
+        self.assertEqual(self.status_texts(), ["Uploading... 0%"])
+        self.assertEqual(self.configures(self.icon), [{"text": "📤"}])
+
+    def test_start_places_over_area(self):
+        """Test that the overlay is positioned over the given area widget"""
+        area = FakeWidget()
+        view = TransferView(self.progress, self.status,
+                            self.status_var, self.icon, area=area)
+        view.start()
+
+        places = [kwargs for name, _, kwargs in self.status.calls if name == "place"]
+        self.assertIs(places[0]["in_"], area)
+
+    def test_unchanged_text_not_reconfigured(self):
+        """Test that repeating the same text skips the configure call"""
+        self.view.update(0.5, "Uploading... 50%")
+        self.view.update(0.5, "Uploading... 50%")
+        self.view.update(0.6, "Uploading... 60%")
+
+        self.assertEqual(len(self.status_texts()), 2)
+        self.assertEqual(len(self.progress.calls), 3)
+
+    def test_mark_failed(self):
+        """Test that a failure hides the bar and shows the error state"""
+        self.view.mark_failed()
+
+        self.assertIn("place_forget", [name for name, _, _ in self.progress.calls])
+        self.assertEqual(self.status_texts(), ["❌ Failed"])
+        self.assertEqual(self.configures(self.status), [{"text_color": "red"}])
+        self.assertEqual(self.configures(self.icon), [{"text": "❌"}])
+
+    def test_color_kept_until_changed(self):
+        """Test that the status color is only reconfigured when it changes"""
+        self.view.mark_failed()
+        self.view.start()
+        self.view.mark_failed()
+
+        self.assertEqual(self.configures(self.status), [{"text_color": "red"}])
+        self.assertEqual(self.status_texts(),
+                         ["❌ Failed", "Uploading... 0%", "❌ Failed"])
+
+    def test_forget_icon_allows_reconfigure(self):
+        """Test that an icon changed elsewhere is set again on the next reset"""
+        self.view.reset()
+        self.view.reset()
+        self.assertEqual(len(self.configures(self.icon)), 1)
+
+        self.view.forget_icon()
+        self.view.reset()
+        self.assertEqual(len(self.configures(self.icon)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()